@@ -162,4 +162,14 @@ def validate_config_structure(config: Dict[str, Any]) -> List[str]:
             elif not isinstance(config["general_settings"]["lists_directory"], str):
                 errors.append("'general_settings.lists_directory' must be a string")
 
+            max_workers = config["general_settings"].get("max_workers", 1)
+            if (
+                not isinstance(max_workers, int)
+                or isinstance(max_workers, bool)
+                or max_workers < 1
+            ):
+                errors.append(
+                    "'general_settings.max_workers' must be a positive integer"
+                )
+
     return errors
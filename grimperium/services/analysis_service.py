@@ -7,16 +7,129 @@ with calculated results, generating comprehensive progress reports.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+import pandas as pd
 
-from .database_service import get_existing_smiles, get_database_stats
 from ..constants import (
+    BYTES_PER_MB,
     DEFAULT_TIME_PER_MOLECULE,
     SECONDS_PER_HOUR,
     TIME_DISPLAY_THRESHOLDS,
 )
 
 
+@dataclass(frozen=True)
+class DatabaseSummary:
+    """
+    Everything the progress reports need to know about one database file.
+
+    Attributes:
+        path: Path to the database CSV file
+        exists: Whether the database file exists
+        smiles: Sorted index of the unique, non-null SMILES in the database
+        total_entries: Number of data rows in the database
+        file_size_bytes: Size of the database file in bytes
+        columns: Column names from the CSV header
+        error: Error message if the file could not be read
+    """
+
+    path: str
+    exists: bool
+    smiles: pd.Index = field(
+        default_factory=lambda: pd.Index([], dtype=object), compare=False
+    )
+    total_entries: int = 0
+    file_size_bytes: int = 0
+    columns: Tuple[str, ...] = ()
+    error: Optional[str] = None
+
+    @property
+    def unique_smiles(self) -> int:
+        """Number of unique SMILES in the database."""
+        return len(self.smiles)
+
+
+@lru_cache(maxsize=2)
+def _read_db_summary(db_path: str, mtime_ns: int, size: int) -> DatabaseSummary:
+    """
+    Read a database CSV once and summarize it.
+
+    Memoized on the file's modification time and size, so an unchanged
+    database is never parsed twice while any write invalidates the entry.
+
+    Args:
+        db_path: Path to the database CSV file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        Summary of the database contents
+    """
+    if size == 0:
+        return DatabaseSummary(path=db_path, exists=True)
+
+    columns = tuple(pd.read_csv(db_path, nrows=0).columns)
+
+    if "smiles" in columns:
+        smiles_series = pd.read_csv(db_path, usecols=["smiles"], dtype=str)["smiles"]
+        total_entries = len(smiles_series)
+        # A hashed pandas Index keeps the set operations below in C
+        smiles = pd.Index(smiles_series.dropna().unique(), dtype=object)
+    else:
+        total_entries = len(pd.read_csv(db_path, usecols=[0], dtype=str))
+        smiles = pd.Index([], dtype=object)
+
+    return DatabaseSummary(
+        path=db_path,
+        exists=True,
+        smiles=smiles.sort_values(),
+        total_entries=total_entries,
+        file_size_bytes=size,
+        columns=columns,
+    )
+
+
+def load_db_summary(db_path: str) -> DatabaseSummary:
+    """
+    Load the summary of a database, reusing it while the file is unchanged.
+
+    Progress reports, detailed analyses and missing-molecule lookups all
+    derive from this summary, so a report touches each database file once.
+
+    Args:
+        db_path: Path to the database CSV file
+
+    Returns:
+        Summary of the database; ``exists`` is False if the file is missing
+        and ``error`` is set if it could not be read
+    """
+    logger = logging.getLogger(__name__)
+
+    try:
+        stat = Path(db_path).stat()
+    except OSError:
+        logger.debug(f"Database file does not exist: {db_path}")
+        return DatabaseSummary(path=db_path, exists=False)
+
+    try:
+        return _read_db_summary(db_path, stat.st_mtime_ns, stat.st_size)
+    except pd.errors.EmptyDataError as e:
+        # Unreadable like any other parse failure, so detailed analyses
+        # report the database as missing
+        logger.warning(f"Database file is empty or corrupted: {db_path}")
+        return DatabaseSummary(
+            path=db_path, exists=True, file_size_bytes=stat.st_size, error=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Error reading database {db_path}: {e}")
+        return DatabaseSummary(path=db_path, exists=True, error=str(e))
+
+
 def generate_progress_report(cbs_db_path: str, pm7_db_path: str) -> Dict[str, Any]:
     """
     Generate comprehensive progress report comparing CBS reference and PM7
@@ -53,15 +166,18 @@ def generate_progress_report(cbs_db_path: str, pm7_db_path: str) -> Dict[str, An
         logger.debug(f"CBS database path: {cbs_db_path}")
         logger.debug(f"PM7 database path: {pm7_db_path}")
 
-        # Get existing SMILES from both databases
-        cbs_smiles = get_existing_smiles(cbs_db_path)
-        pm7_smiles = get_existing_smiles(pm7_db_path)
+        # Get existing SMILES from both databases; the CSV parser releases
+        # the GIL, so cold reads of the two files overlap
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cbs_summary, pm7_summary = executor.map(
+                load_db_summary, (cbs_db_path, pm7_db_path)
+            )
+        cbs_smiles = cbs_summary.smiles
+        pm7_smiles = pm7_summary.smiles
 
         # Check if databases exist
-        from pathlib import Path
-
-        cbs_exists = Path(cbs_db_path).exists()
-        pm7_exists = Path(pm7_db_path).exists()
+        cbs_exists = cbs_summary.exists
+        pm7_exists = pm7_summary.exists
 
         logger.debug(
             f"CBS database exists: {cbs_exists}, " f"SMILES count: {len(cbs_smiles)}"
@@ -79,10 +195,8 @@ def generate_progress_report(cbs_db_path: str, pm7_db_path: str) -> Dict[str, An
         common_count = len(common_smiles)
 
         # Calculate missing and extra molecules
-        missing_smiles = cbs_smiles - pm7_smiles  # In CBS but not in PM7
-        extra_smiles = pm7_smiles - cbs_smiles  # In PM7 but not in CBS
-        missing_count = len(missing_smiles)
-        extra_count = len(extra_smiles)
+        missing_count = total_cbs - common_count  # In CBS but not in PM7
+        extra_count = total_pm7 - common_count  # In PM7 but not in CBS
 
         # Calculate progress percentage
         if total_cbs > 0:
@@ -153,28 +267,25 @@ def get_detailed_database_analysis(db_path: str) -> Dict[str, Any]:
 
     try:
         # Get basic database statistics
-        stats = get_database_stats(db_path)
+        summary = load_db_summary(db_path)
 
-        if not stats.get("exists", False):
+        if not summary.exists or summary.error:
             return {
                 "exists": False,
                 "path": db_path,
-                "error": stats.get("error", "Database file does not exist"),
+                "error": summary.error or "Database file does not exist",
             }
 
-        # Get SMILES for additional analysis
-        smiles_set = get_existing_smiles(db_path)
-
         # Calculate additional metrics
         analysis = {
             "exists": True,
             "path": db_path,
-            "total_entries": stats.get("total_entries", 0),
-            "unique_smiles": len(smiles_set),
-            "file_size_bytes": stats.get("file_size_bytes", 0),
-            "file_size_mb": stats.get("file_size_bytes", 0) / (1024 * 1024),
-            "columns": stats.get("columns", []),
-            "column_count": len(stats.get("columns", [])),
+            "total_entries": summary.total_entries,
+            "unique_smiles": summary.unique_smiles,
+            "file_size_bytes": summary.file_size_bytes,
+            "file_size_mb": summary.file_size_bytes / BYTES_PER_MB,
+            "columns": list(summary.columns),
+            "column_count": len(summary.columns),
         }
 
         # Calculate data quality metrics
@@ -220,16 +331,18 @@ def find_missing_molecules(
 
     try:
         # Get SMILES from both databases
-        cbs_smiles = get_existing_smiles(cbs_db_path)
-        pm7_smiles = get_existing_smiles(pm7_db_path)
+        cbs_smiles = load_db_summary(cbs_db_path).smiles
+        pm7_smiles = load_db_summary(pm7_db_path).smiles
 
-        # Find missing molecules
-        missing_smiles = cbs_smiles - pm7_smiles
-        missing_list = sorted(list(missing_smiles))
+        # Find missing molecules; the CBS index is already sorted
+        missing_smiles = cbs_smiles[~cbs_smiles.isin(pm7_smiles)]
 
-        # Apply limit if specified
+        # Apply limit before converting, so only the returned rows become
+        # Python strings
         if limit is not None and limit > 0:
-            missing_list = missing_list[:limit]
+            missing_list = missing_smiles[:limit].tolist()
+        else:
+            missing_list = missing_smiles.tolist()
 
         logger.info(
             f"Found {len(missing_smiles)} missing molecules, "
@@ -7,14 +7,18 @@ race conditions and pandas for efficient data manipulation.
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 from filelock import FileLock
 
 from ..constants import DATABASE_LOCK_TIMEOUT
 
+# SMILES known per database path, tagged with the (mtime_ns, size) they reflect
+_smiles_index: Dict[str, Tuple[Tuple[int, int], Set[str]]] = {}
+
 
 def get_existing_smiles(db_path: str) -> Set[str]:
     """
@@ -91,6 +95,59 @@ def get_existing_smiles(db_path: str) -> Set[str]:
         return set()
 
 
+def _db_stat_key(db_path: str) -> Optional[Tuple[int, int]]:
+    """Return the (mtime_ns, size) of a database file, None if it is missing."""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def smiles_exists(db_path: str, smiles: str) -> bool:
+    """
+    Check whether a SMILES is already stored in the database.
+
+    The SMILES column is read once and kept in memory while the file's
+    modification time and size are unchanged, so consecutive checks
+    against the same database do not re-scan it. Appends made through
+    append_to_database update the cached set instead of invalidating it.
+
+    Args:
+        db_path: Path to the CSV database file
+        smiles: SMILES string to look up
+
+    Returns:
+        True if the SMILES is present in the database
+    """
+    key = _db_stat_key(db_path)
+    if key is None:
+        return False
+
+    cached = _smiles_index.get(db_path)
+    if cached is None or cached[0] != key:
+        cached = (key, get_existing_smiles(db_path))
+        _smiles_index[db_path] = cached
+
+    return smiles in cached[1]
+
+
+def _record_appended_smiles(db_path: str, smiles: str) -> None:
+    """
+    Add a just-appended SMILES to the cached set of its database.
+
+    Must be called while holding the database lock, right after the append,
+    so no other writer can have changed the file in between.
+    """
+    cached = _smiles_index.get(db_path)
+    key = _db_stat_key(db_path)
+    if cached is None or key is None:
+        return
+
+    cached[1].add(smiles)
+    _smiles_index[db_path] = (key, cached[1])
+
+
 def update_database_entry(
     molecule_data: Dict[str, any], db_path: str, schema: List[str]
 ) -> bool:
@@ -300,9 +357,7 @@ def append_to_database(
                 # Check if database file exists
                 if db_file.exists():
                     # File exists - check for duplicates and append
-                    existing_smiles = get_existing_smiles(db_path)
-
-                    if smiles in existing_smiles:
+                    if smiles_exists(db_path, smiles):
                         logger.warning(
                             f"SMILES '{smiles}' already exists in database, "
                             f"skipping"
@@ -330,6 +385,7 @@ def append_to_database(
                         index=False,  # don't write index
                         encoding="utf-8",
                     )
+                    _record_appended_smiles(db_path, smiles)
 
                 else:
                     # File doesn't exist - create new database
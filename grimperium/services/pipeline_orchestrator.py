@@ -28,6 +28,11 @@ from ..services import (
 from ..config.defaults import get_database_schema
 from ..utils.file_utils import ensure_directory_exists
 
+# Runs of unsafe characters and underscores, each collapsed to one "_"
+UNSAFE_IDENTIFIER_RUN_PATTERN = re.compile(
+    rf"(?:{FILENAME_SANITIZATION_PATTERN}|{MULTIPLE_UNDERSCORES_PATTERN})+"
+)
+
 
 def sanitize_identifier(identifier: str) -> str:
     """
@@ -39,10 +44,8 @@ def sanitize_identifier(identifier: str) -> str:
     Returns:
         A sanitized directory-safe string
     """
-    # Replace unsafe characters and spaces
-    sanitized = re.sub(FILENAME_SANITIZATION_PATTERN, "_", identifier)
-    # Remove multiple underscores
-    sanitized = re.sub(MULTIPLE_UNDERSCORES_PATTERN, "_", sanitized)
+    # Replace unsafe characters and spaces, collapsing underscores, in one pass
+    sanitized = UNSAFE_IDENTIFIER_RUN_PATTERN.sub("_", identifier)
     # Remove leading/trailing underscores and dots
     sanitized = sanitized.strip("_.")
     # Ensure we have something left
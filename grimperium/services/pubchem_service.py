@@ -19,6 +19,12 @@ from ..constants import (
     PUBCHEM_SANITIZATION_REPLACEMENT,
 )
 
+# Compiled once; sanitize_filename runs for every downloaded molecule
+UNSAFE_FILENAME_CHARS_PATTERN = re.compile(FILENAME_SANITIZATION_PATTERN)
+
+# Suffix of the file recording which compound name an SDF was downloaded for
+SDF_SOURCE_SUFFIX = ".sdf.source"
+
 
 def sanitize_filename(name: str) -> str:
     """
@@ -34,8 +40,8 @@ def sanitize_filename(name: str) -> str:
         A sanitized filename-safe string
     """
     # Replace unsafe characters and spaces using constants
-    sanitized = re.sub(
-        FILENAME_SANITIZATION_PATTERN, PUBCHEM_SANITIZATION_REPLACEMENT, name
+    sanitized = UNSAFE_FILENAME_CHARS_PATTERN.sub(
+        PUBCHEM_SANITIZATION_REPLACEMENT, name
     )
     # Remove leading/trailing dots and spaces
     sanitized = sanitized.strip(". ")
@@ -45,18 +51,32 @@ def sanitize_filename(name: str) -> str:
     return sanitized
 
 
-def download_sdf_by_name(name: str, output_dir: str) -> Optional[str]:
+def _read_sdf_source(source_path: Path) -> Optional[str]:
+    """Return the compound name an SDF was downloaded for, None if unknown."""
+    try:
+        return source_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def download_sdf_by_name(
+    name: str, output_dir: str, reuse_existing: bool = True
+) -> Optional[str]:
     """
     Download a 3D SDF structure file for a compound by name from PubChem.
 
     This function searches PubChem for a compound by name, retrieves its 3D
     structure data, and saves it as an SDF file in the specified directory.
     The function includes robust error handling for network issues and
-    missing compounds.
+    missing compounds. A structure saved by an earlier run for the exact
+    same name is reused without contacting PubChem.
 
     Args:
         name: The compound name to search for in PubChem
         output_dir: Directory where the SDF file should be saved
+        reuse_existing: Return a previously downloaded, non-empty SDF file
+            instead of querying PubChem again, provided it was downloaded
+            for this exact name
 
     Returns:
         The full path to the downloaded SDF file if successful, None otherwise
@@ -72,6 +92,24 @@ def download_sdf_by_name(name: str, output_dir: str) -> Optional[str]:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
+        # Create sanitized filename
+        sanitized_name = sanitize_filename(name)
+        sdf_filename = f"{sanitized_name}.sdf"
+        sdf_path = output_path / sdf_filename
+        # Different names can sanitize to the same filename, or differ only
+        # by case on case-insensitive filesystems, so reuse is keyed on the
+        # exact name recorded next to the SDF
+        source_path = sdf_path.with_suffix(SDF_SOURCE_SUFFIX)
+
+        if (
+            reuse_existing
+            and sdf_path.is_file()
+            and sdf_path.stat().st_size > 0
+            and _read_sdf_source(source_path) == name
+        ):
+            logger.info(f"Using previously downloaded SDF file: {sdf_path}")
+            return str(sdf_path.absolute())
+
         # Search for the compound by name
         logger.info(f"Searching PubChem for compound: {name}")
         compounds = pcp.get_compounds(name, "name")
@@ -108,14 +146,16 @@ def download_sdf_by_name(name: str, output_dir: str) -> Optional[str]:
                 logger.error(f"Failed to retrieve any structure for {name}: {e2}")
                 return None
 
-        # Create sanitized filename
-        sanitized_name = sanitize_filename(name)
-        sdf_filename = f"{sanitized_name}.sdf"
-        sdf_path = output_path / sdf_filename
-
-        # Write SDF data to file
-        with open(sdf_path, "w", encoding="utf-8") as f:
+        # Write to a temporary file first so an interrupted run never leaves
+        # a truncated SDF behind for the next run to reuse
+        tmp_path = sdf_path.with_suffix(".sdf.part")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             f.write(sdf_data)
+        # Drop the old source first, so an interruption between the two
+        # writes leaves an SDF that is never reused rather than mislabelled
+        source_path.unlink(missing_ok=True)
+        tmp_path.replace(sdf_path)
+        source_path.write_text(name, encoding="utf-8")
 
         logger.info(f"Successfully downloaded SDF file: {sdf_path}")
         return str(sdf_path.absolute())
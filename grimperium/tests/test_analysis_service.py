@@ -0,0 +1,147 @@
+"""
+Tests for the analysis_service module.
+
+This module contains tests for progress reporting, database analysis
+and missing-molecule detection built on cached database summaries.
+"""
+
+import pandas as pd
+from unittest.mock import patch
+import pytest
+
+from grimperium.services import analysis_service
+
+
+class TestAnalysisService:
+    """Test the analysis service functionality."""
+
+    @pytest.fixture
+    def cbs_db(self, tmp_path):
+        """Create a CBS reference database."""
+        db_path = tmp_path / "thermo_cbs.csv"
+        pd.DataFrame({"smiles": ["CCO", "CO", "C", "CC"]}).to_csv(
+            db_path, index=False
+        )
+        return str(db_path)
+
+    @pytest.fixture
+    def pm7_db(self, tmp_path):
+        """Create a PM7 calculated database."""
+        db_path = tmp_path / "thermo_pm7.csv"
+        pd.DataFrame(
+            {
+                "smiles": ["CCO", "CO", "CCO", "O"],
+                "pm7_energy": [-10.5, -8.2, -10.5, -57.8],
+            }
+        ).to_csv(db_path, index=False)
+        return str(db_path)
+
+    def test_load_db_summary(self, pm7_db):
+        """Test summarizing a populated database."""
+        summary = analysis_service.load_db_summary(pm7_db)
+
+        assert summary.exists is True
+        assert summary.total_entries == 4
+        assert summary.smiles.tolist() == ["CCO", "CO", "O"]
+        assert summary.unique_smiles == 3
+        assert summary.columns == ("smiles", "pm7_energy")
+
+    def test_load_db_summary_missing_file(self, tmp_path):
+        """Test summarizing a database that does not exist."""
+        summary = analysis_service.load_db_summary(str(tmp_path / "missing.csv"))
+
+        assert summary.exists is False
+        assert len(summary.smiles) == 0
+        assert summary.total_entries == 0
+
+    def test_load_db_summary_reads_file_once(self, cbs_db, pm7_db):
+        """Test that a full report parses each unchanged database once."""
+        analysis_service._read_db_summary.cache_clear()
+
+        with patch(
+            "grimperium.services.analysis_service.pd.read_csv",
+            wraps=pd.read_csv,
+        ) as mock_read:
+            analysis_service.generate_progress_report(cbs_db, pm7_db)
+            analysis_service.get_detailed_database_analysis(cbs_db)
+            analysis_service.get_detailed_database_analysis(pm7_db)
+            analysis_service.find_missing_molecules(cbs_db, pm7_db)
+
+        # One header read plus one column read per database
+        assert mock_read.call_count == 4
+
+    def test_load_db_summary_detects_changes(self, pm7_db):
+        """Test that appending to a database invalidates its summary."""
+        analysis_service.load_db_summary(pm7_db)
+
+        with open(pm7_db, "a") as f:
+            f.write("CCC,-25.0\n")
+
+        summary = analysis_service.load_db_summary(pm7_db)
+        assert "CCC" in summary.smiles
+        assert summary.total_entries == 5
+
+    def test_generate_progress_report(self, cbs_db, pm7_db):
+        """Test progress metrics derived from both databases."""
+        report = analysis_service.generate_progress_report(cbs_db, pm7_db)
+
+        assert report["total_cbs"] == 4
+        assert report["total_pm7"] == 3
+        assert report["common_count"] == 2
+        assert report["missing_count"] == 2
+        assert report["extra_count"] == 1
+        assert report["progress_percentage"] == pytest.approx(50.0)
+        assert report["cbs_exists"] is True
+        assert report["pm7_exists"] is True
+
+    def test_get_detailed_database_analysis(self, pm7_db):
+        """Test detailed analysis of a database with duplicates."""
+        analysis = analysis_service.get_detailed_database_analysis(pm7_db)
+
+        assert analysis["exists"] is True
+        assert analysis["total_entries"] == 4
+        assert analysis["unique_smiles"] == 3
+        assert analysis["column_count"] == 2
+        assert analysis["data_quality"] == "Needs Review"
+
+    def test_get_detailed_database_analysis_missing_file(self, tmp_path):
+        """Test detailed analysis of a missing database."""
+        analysis = analysis_service.get_detailed_database_analysis(
+            str(tmp_path / "missing.csv")
+        )
+
+        assert analysis["exists"] is False
+        assert "error" in analysis
+
+    def test_get_detailed_database_analysis_zero_byte_file(self, tmp_path):
+        """Test that a zero-byte database is an existing, empty database."""
+        db_path = tmp_path / "empty.csv"
+        db_path.write_text("")
+
+        analysis = analysis_service.get_detailed_database_analysis(str(db_path))
+
+        assert analysis["exists"] is True
+        assert analysis["data_quality"] == "Empty"
+
+    def test_get_detailed_database_analysis_unparsable_file(self, tmp_path):
+        """Test that a database without any CSV content is reported missing."""
+        db_path = tmp_path / "blank.csv"
+        db_path.write_text("\n\n")
+
+        analysis = analysis_service.get_detailed_database_analysis(str(db_path))
+        report = analysis_service.generate_progress_report(
+            str(db_path), str(db_path)
+        )
+
+        assert analysis["exists"] is False
+        assert "error" in analysis
+        assert report["cbs_exists"] is True
+        assert report["total_cbs"] == 0
+
+    def test_find_missing_molecules(self, cbs_db, pm7_db):
+        """Test listing reference molecules without PM7 results."""
+        assert analysis_service.find_missing_molecules(cbs_db, pm7_db) == [
+            "C",
+            "CC",
+        ]
+        assert analysis_service.find_missing_molecules(cbs_db, pm7_db, 1) == ["C"]
@@ -5,6 +5,8 @@ This module contains tests for configuration loading, validation,
 and error handling functionality.
 """
 
+import os
+
 import yaml
 from unittest.mock import patch, Mock
 import pytest
@@ -70,6 +72,120 @@ class TestConfigManager:
         # Should return None for invalid YAML
         assert result is None
 
+    @pytest.mark.parametrize("max_workers", ["auto", 4.5, 0, True])
+    def test_load_config_rejects_invalid_max_workers(
+        self, valid_config_dict, tmp_path, max_workers
+    ):
+        """Test that max_workers must be a positive integer."""
+        valid_config_dict["general_settings"]["max_workers"] = max_workers
+        config_file = tmp_path / "config.yaml"
+        with open(config_file, "w") as f:
+            yaml.dump(valid_config_dict, f)
+
+        assert config_manager.load_config(str(config_file), tmp_path) is None
+
+    def test_load_config_reuses_cached_parse(self, valid_config_file, tmp_path):
+        """Test that an unchanged file is parsed only once."""
+        config_manager._parse_yaml_file.cache_clear()
+
+        with patch(
+            "grimperium.utils.config_manager.yaml.load", wraps=yaml.load
+        ) as mock_load:
+            first = config_manager.load_config(valid_config_file, tmp_path)
+            second = config_manager.load_config(valid_config_file, tmp_path)
+
+        assert mock_load.call_count == 1
+        assert first == second
+        # Each caller receives an independent copy
+        first["executables"]["crest"] = "modified"
+        assert second["executables"]["crest"] == "crest"
+
+    def test_load_config_reparses_modified_file(
+        self, valid_config_file, valid_config_dict, tmp_path
+    ):
+        """Test that editing the file invalidates the cached parse."""
+        config_manager.load_config(valid_config_file, tmp_path)
+
+        valid_config_dict["crest_keywords"] = "--gfnff"
+        with open(valid_config_file, "w") as f:
+            yaml.dump(valid_config_dict, f)
+        stat = os.stat(valid_config_file)
+        os.utime(
+            valid_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000)
+        )
+
+        config = config_manager.load_config(valid_config_file, tmp_path)
+        assert config["crest_keywords"] == "--gfnff"
+
+    def test_load_config_reparses_resized_file_with_same_mtime(
+        self, valid_config_file, valid_config_dict, tmp_path
+    ):
+        """Test that a size change alone invalidates the cached parse."""
+        config_manager.load_config(valid_config_file, tmp_path)
+        stat = os.stat(valid_config_file)
+
+        valid_config_dict["crest_keywords"] = "--gfnff"
+        with open(valid_config_file, "w") as f:
+            yaml.dump(valid_config_dict, f)
+        os.utime(valid_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        config = config_manager.load_config(valid_config_file, tmp_path)
+        assert config["crest_keywords"] == "--gfnff"
+
+    def test_load_config_uses_json_cache(self, valid_config_file, tmp_path):
+        """Test that a fresh process reads the JSON cache instead of YAML."""
+        config_manager._parse_yaml_file.cache_clear()
+        first = config_manager.load_config(valid_config_file, tmp_path)
+        assert os.path.exists(valid_config_file + ".json")
+
+        # Simulate a new process: the in-memory cache is empty
+        config_manager._parse_yaml_file.cache_clear()
+        with patch(
+            "grimperium.utils.config_manager.yaml.load", wraps=yaml.load
+        ) as mock_load:
+            second = config_manager.load_config(valid_config_file, tmp_path)
+
+        assert mock_load.call_count == 0
+        assert first == second
+
+    def test_load_config_ignores_stale_json_cache(
+        self, valid_config_file, valid_config_dict, tmp_path
+    ):
+        """Test that a JSON cache from an older YAML version is not used."""
+        config_manager.load_config(valid_config_file, tmp_path)
+
+        valid_config_dict["crest_keywords"] = "--gfnff"
+        with open(valid_config_file, "w") as f:
+            yaml.dump(valid_config_dict, f)
+        stat = os.stat(valid_config_file)
+        os.utime(
+            valid_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000)
+        )
+        config_manager._parse_yaml_file.cache_clear()
+
+        config = config_manager.load_config(valid_config_file, tmp_path)
+        assert config["crest_keywords"] == "--gfnff"
+
+    @pytest.mark.parametrize(
+        "keywords", ["--gfnff", "--gfn0"], ids=["new-size", "same-size"]
+    )
+    def test_load_config_ignores_json_cache_with_restored_mtime(
+        self, valid_config_file, valid_config_dict, tmp_path, keywords
+    ):
+        """Test that an edit keeping the old timestamp is not hidden by the cache."""
+        config_manager.load_config(valid_config_file, tmp_path)
+        stat = os.stat(valid_config_file)
+
+        # Like ``cp -p`` or a checkout that restores timestamps
+        valid_config_dict["crest_keywords"] = keywords
+        with open(valid_config_file, "w") as f:
+            yaml.dump(valid_config_dict, f)
+        os.utime(valid_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        config_manager._parse_yaml_file.cache_clear()
+
+        config = config_manager.load_config(valid_config_file, tmp_path)
+        assert config["crest_keywords"] == keywords
+
     def test_load_config_missing_required_sections(self, tmp_path):
         """Test loading config with missing required sections."""
         incomplete_config = {
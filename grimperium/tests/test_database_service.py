@@ -124,6 +124,35 @@ class TestDatabaseService:
             assert len(df) == 2  # Still only original entries
             assert "ethanol_copy" not in df["identifier"].values
 
+    def test_smiles_exists_reuses_index_across_appends(self, temp_csv_file):
+        """Test that appends update the SMILES index without re-reading."""
+        schema = ["identifier", "smiles", "pm7_energy", "status"]
+
+        with patch(
+            "grimperium.services.database_service.get_existing_smiles",
+            wraps=database_service.get_existing_smiles,
+        ) as mock_read, patch("grimperium.services.database_service.FileLock"):
+            for identifier, smiles in [("propanol", "CCCO"), ("butanol", "CCCCO")]:
+                assert database_service.append_to_database(
+                    {"identifier": identifier, "smiles": smiles}, temp_csv_file, schema
+                )
+            # A repeated molecule is still rejected
+            assert not database_service.append_to_database(
+                {"identifier": "propanol", "smiles": "CCCO"}, temp_csv_file, schema
+            )
+
+        assert mock_read.call_count == 1
+        assert len(pd.read_csv(temp_csv_file)) == 4
+
+    def test_smiles_exists_detects_external_changes(self, temp_csv_file):
+        """Test that a file rewritten elsewhere is read again."""
+        assert database_service.smiles_exists(temp_csv_file, "CCO")
+
+        pd.DataFrame({"smiles": ["CCCCCO"]}).to_csv(temp_csv_file, index=False)
+
+        assert not database_service.smiles_exists(temp_csv_file, "CCO")
+        assert database_service.smiles_exists(temp_csv_file, "CCCCCO")
+
     def test_append_to_database_new_file_creation(self, tmp_path):
         """Test creating a new database file."""
         new_csv_file = tmp_path / "new_database.csv"
@@ -0,0 +1,228 @@
+"""
+Tests for the main module helpers.
+
+This module contains tests for the CLI helpers that do not need the
+external chemistry programs: version probing with fake executables,
+the interactive menu loop, batch identifier files and batch counts.
+"""
+
+import logging
+import sys
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+import pytest
+
+import main
+from grimperium.utils import config_manager
+
+
+@pytest.fixture
+def fake_executable(tmp_path):
+    """Create a shell script that writes the given lines in separate flushes."""
+
+    def _make(name, lines):
+        script = tmp_path / name
+        body = "\n".join(f"echo '{line}'; sleep 0.05" for line in lines)
+        script.write_text(f"#!/bin/sh\n{body}\n")
+        script.chmod(0o755)
+        return str(script)
+
+    return _make
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses shell scripts")
+class TestExecutableVersion:
+    """Test version probing of external executables."""
+
+    def test_banner_written_in_several_flushes(self, fake_executable):
+        """Test that the version line after the first write is still found."""
+        exe_path = fake_executable("crest", ["==========", " Version 2.12"])
+
+        assert main.get_executable_version("crest", exe_path) == "Version 2.12"
+
+    def test_fallback_message_is_not_cached(self, fake_executable):
+        """Test that a banner without a version line is probed again."""
+        exe_path = fake_executable("obabel", ["loading"])
+
+        assert main.get_executable_version("obabel", exe_path) == (
+            "Version info available"
+        )
+        assert not any(key[1] == exe_path for key in main._executable_versions)
+
+
+class TestInteractiveMenu:
+    """Test the interactive menu loop."""
+
+    def test_unexpected_handler_error_returns_to_menu(self):
+        """Test that a handler bug is reported and the menu keeps running."""
+        answers = iter(["Verificar o status do sistema", "Sair"])
+
+        with patch("questionary.select") as mock_select, patch.object(
+            main, "handle_system_info", side_effect=RuntimeError("boom")
+        ), patch.object(main, "_warm_menu_caches"):
+            mock_select.return_value.ask.side_effect = lambda: next(answers)
+            main.interactive_menu()
+
+        assert mock_select.call_count == 2
+
+    def test_warm_up_only_parses_the_config(self, tmp_path, caplog):
+        """Test that the warm-up caches the parse without loading the config."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            f"repository_base_path: {tmp_path / 'repository'}\n"
+            f"general_settings: {{lists_directory: {tmp_path / 'lists'}}}\n"
+        )
+        config_manager._parse_yaml_file.cache_clear()
+
+        with caplog.at_level(logging.INFO), patch(
+            "grimperium.utils.config_manager.load_config"
+        ) as mock_load:
+            warm_up = threading.Thread(
+                target=main._warm_menu_caches, args=(str(config_file),)
+            )
+            warm_up.start()
+            warm_up.join()
+
+        mock_load.assert_not_called()
+        assert config_manager._parse_yaml_file.cache_info().currsize == 1
+        # Nothing printed over the prompt and no configured directories made
+        assert caplog.records == []
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "config.yaml", "config.yaml.json"
+        ]
+
+
+class TestBatchIdentifiers:
+    """Test reading identifiers from batch files."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "ethanol\n\nacetic acid\n  CCO  \n",
+            "ethanol\r\n\r\nacetic acid\r\n  CCO  \r\n",
+            "ethanol\r\racetic acid\r  CCO  \r",
+        ],
+        ids=["lf", "crlf", "cr"],
+    )
+    def test_newline_styles(self, tmp_path, content):
+        """Test that every newline style yields the same identifiers."""
+        batch_file = tmp_path / "batch.txt"
+        batch_file.write_bytes(content.encode("utf-8"))
+
+        identifiers = list(main._iter_identifiers(str(batch_file)))
+
+        assert identifiers == ["ethanol", "acetic acid", "CCO"]
+        assert main._count_identifiers(str(batch_file)) == len(identifiers)
+
+    def test_unicode_whitespace_is_stripped(self, tmp_path):
+        """Test that non-breaking spaces count as blank space."""
+        batch_file = tmp_path / "batch.txt"
+        batch_file.write_text(" ethanol \n \n", encoding="utf-8")
+
+        assert list(main._iter_identifiers(str(batch_file))) == ["ethanol"]
+        assert main._count_identifiers(str(batch_file)) == 1
+
+
+class TestBatchLogic:
+    """Test batch processing counts with the pipeline mocked out."""
+
+    @pytest.fixture
+    def run_batch(self, tmp_path):
+        """Run the batch logic on identifiers with a mocked pipeline."""
+        pm7_db = tmp_path / "thermo_pm7.csv"
+        pm7_db.write_text("identifier,smiles\nethanol,CCO\n")
+        config = {
+            "database": {"pm7_db_path": str(pm7_db)},
+            "general_settings": {"batch_executor": "thread"},
+        }
+
+        def _run(identifiers, jobs=1, outcome=True, side_effect=None):
+            with patch(
+                "grimperium.utils.config_manager.load_config", return_value=config
+            ), patch.object(
+                main, "_validate_pipeline_setup_cached", return_value=True
+            ), patch(
+                "grimperium.services.pipeline_orchestrator.process_single_molecule",
+                return_value=outcome,
+                side_effect=side_effect,
+            ) as mock_process:
+                result = main._execute_batch_logic(
+                    None, "config.yaml", identifiers=identifiers,
+                    quiet=True, jobs=jobs,
+                )
+            return result, mock_process
+
+        return _run
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_repeats_run_once_and_count_as_calculated(self, run_batch, jobs):
+        """Test that known SMILES and repeats skip the pipeline."""
+        result, mock_process = run_batch(
+            ["CCO", "water", "water", "CO", "CCO"], jobs=jobs
+        )
+
+        assert mock_process.call_count == 2
+        assert result["successful"] == 2
+        assert result["skipped"] == 3
+        assert result["failed"] == 0
+
+    def test_repeats_of_a_failure_count_as_failed(self, run_batch):
+        """Test that every occurrence of a failed identifier is a failure."""
+        result, mock_process = run_batch(["water", "water"], outcome=False)
+
+        assert mock_process.call_count == 1
+        assert result["failed"] == 2
+
+    def test_repeats_are_detected_within_a_window(self, run_batch):
+        """Test that the input is consumed in bounded windows."""
+        with patch.object(main, "BATCH_WINDOW_SIZE", 2):
+            result, mock_process = run_batch(["water", "CO", "water"])
+
+        # "water" falls into two windows, so it runs once in each
+        assert mock_process.call_count == 3
+        assert result["successful"] == 3
+
+    def test_colliding_work_dirs_never_run_at_once(self, run_batch):
+        """Test that identifiers sharing a directory are not run in parallel."""
+        active = set()
+        collisions = []
+        lock = threading.Lock()
+
+        def fake_process(identifier, config):
+            work_dir = identifier.replace("\\", "/")
+            with lock:
+                if work_dir in active:
+                    collisions.append(identifier)
+                active.add(work_dir)
+            time.sleep(0.05)
+            with lock:
+                active.discard(work_dir)
+            return True
+
+        # cis and trans isomers both sanitize to C_C=C_C
+        result, _ = run_batch(
+            ["C/C=C/C", "C/C=C\\C", "CO"], jobs=2, side_effect=fake_process
+        )
+
+        assert collisions == []
+        assert result["successful"] == 3
+
+    def test_broken_worker_pool_still_reports_counts(self, run_batch):
+        """Test that a dead worker process fails the rest instead of raising."""
+
+        def fake_group(identifiers, config=None):
+            if "boom" in identifiers:
+                raise BrokenProcessPool("worker died")
+            return [True] * len(identifiers)
+
+        with patch.object(main, "BATCH_WINDOW_SIZE", 2), patch.object(
+            main, "_process_batch_group", fake_group
+        ):
+            result, _ = run_batch(["water", "boom", "CO", "N"], jobs=2)
+
+        assert result["total"] == 4
+        assert result["successful"] == 1
+        assert result["failed"] == 3
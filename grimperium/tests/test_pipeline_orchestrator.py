@@ -35,6 +35,7 @@ class TestSanitizeIdentifier:
         )
         assert sanitize_identifier("name with spaces") == "name_with_spaces"
         assert sanitize_identifier("multiple___underscores") == "multiple_underscores"
+        assert sanitize_identifier("mixed_ <run>_:_name") == "mixed_run_name"
 
     def test_edge_cases(self):
         """Test edge cases for sanitization."""
@@ -0,0 +1,83 @@
+"""
+Tests for the pubchem_service module.
+
+This module contains tests for SDF downloads, using mocks in place of
+the PubChem web service.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from grimperium.services import pubchem_service
+
+
+class TestDownloadSdfByName:
+    """Test downloading SDF structures from PubChem."""
+
+    def test_download_writes_sdf(self, tmp_path):
+        """Test that a downloaded structure is written to the output dir."""
+        compound = MagicMock(cid=702, iupac_name="ethanol")
+
+        with patch.object(
+            pubchem_service.pcp, "get_compounds", return_value=[compound]
+        ), patch.object(pubchem_service.pcp, "get_sdf", return_value="SDF DATA"):
+            sdf_path = pubchem_service.download_sdf_by_name("ethanol", str(tmp_path))
+
+        assert sdf_path == str((tmp_path / "ethanol.sdf").absolute())
+        assert (tmp_path / "ethanol.sdf").read_text() == "SDF DATA"
+        assert (tmp_path / "ethanol.sdf.source").read_text() == "ethanol"
+        assert not (tmp_path / "ethanol.sdf.part").exists()
+
+    def test_download_reuses_existing_sdf(self, tmp_path):
+        """Test that an SDF from a previous run skips the PubChem query."""
+        (tmp_path / "ethanol.sdf").write_text("CACHED SDF")
+        (tmp_path / "ethanol.sdf.source").write_text("ethanol")
+
+        with patch.object(pubchem_service.pcp, "get_compounds") as mock_get:
+            sdf_path = pubchem_service.download_sdf_by_name("ethanol", str(tmp_path))
+
+        mock_get.assert_not_called()
+        assert sdf_path == str((tmp_path / "ethanol.sdf").absolute())
+
+    def test_download_ignores_empty_sdf(self, tmp_path):
+        """Test that an empty SDF file is downloaded again."""
+        (tmp_path / "ethanol.sdf").write_text("")
+        compound = MagicMock(cid=702, iupac_name="ethanol")
+
+        with patch.object(
+            pubchem_service.pcp, "get_compounds", return_value=[compound]
+        ), patch.object(pubchem_service.pcp, "get_sdf", return_value="SDF DATA"):
+            pubchem_service.download_sdf_by_name("ethanol", str(tmp_path))
+
+        assert (tmp_path / "ethanol.sdf").read_text() == "SDF DATA"
+
+    def test_download_ignores_sdf_of_another_name(self, tmp_path):
+        """Test that a name sanitizing to the same file is downloaded again."""
+        # "ethanol?" and "ethanol_" both sanitize to "ethanol_"
+        (tmp_path / "ethanol_.sdf").write_text("OTHER SDF")
+        (tmp_path / "ethanol_.sdf.source").write_text("ethanol?")
+        compound = MagicMock(cid=702, iupac_name="ethanol")
+
+        with patch.object(
+            pubchem_service.pcp, "get_compounds", return_value=[compound]
+        ) as mock_get, patch.object(
+            pubchem_service.pcp, "get_sdf", return_value="SDF DATA"
+        ):
+            pubchem_service.download_sdf_by_name("ethanol_", str(tmp_path))
+
+        mock_get.assert_called_once()
+        assert (tmp_path / "ethanol_.sdf").read_text() == "SDF DATA"
+        assert (tmp_path / "ethanol_.sdf.source").read_text() == "ethanol_"
+
+    def test_download_ignores_sdf_without_source(self, tmp_path):
+        """Test that an SDF of unknown origin is not trusted."""
+        (tmp_path / "ethanol.sdf").write_text("UNKNOWN SDF")
+        compound = MagicMock(cid=702, iupac_name="ethanol")
+
+        with patch.object(
+            pubchem_service.pcp, "get_compounds", return_value=[compound]
+        ) as mock_get, patch.object(
+            pubchem_service.pcp, "get_sdf", return_value="SDF DATA"
+        ):
+            pubchem_service.download_sdf_by_name("ethanol", str(tmp_path))
+
+        mock_get.assert_called_once()
@@ -6,13 +6,26 @@ from YAML files, ensuring all required settings are present and valid.
 Refactored version with smaller, focused functions.
 """
 
+import copy
+import hashlib
+import json
 import logging
+import os
+import stat
 import subprocess
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import yaml
 
+try:
+    # Prefer the libyaml C bindings when PyYAML was built with them
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from ..constants import (
     EXECUTABLE_VALIDATION_TIMEOUT,
     REQUIRED_EXECUTABLES,
@@ -20,6 +33,124 @@ from ..constants import (
 from ..config.defaults import validate_config_structure
 
 
+# Suffix of the JSON cache written next to a parsed YAML configuration
+CONFIG_CACHE_SUFFIX = ".json"
+
+
+def _config_source_tag(mtime_ns: int, content: bytes) -> Dict[str, Any]:
+    """
+    Describe the YAML version a JSON config cache was written for.
+
+    Args:
+        mtime_ns: Modification time of the YAML file in nanoseconds
+        content: Raw bytes of the YAML file
+
+    Returns:
+        Dictionary with the modification time, size and SHA-256 of the file
+    """
+    return {
+        "mtime_ns": mtime_ns,
+        "size": len(content),
+        "sha256": hashlib.sha256(content).hexdigest(),
+    }
+
+
+def _read_config_cache(cache_path: str, source: Dict[str, Any]) -> Any:
+    """
+    Read a JSON config cache if it was written for the given YAML version.
+
+    Args:
+        cache_path: Path to the JSON cache file
+        source: Tag of the current YAML file from ``_config_source_tag``
+
+    Returns:
+        Cached configuration, None if the cache is missing, stale or unreadable
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("source") != source:
+        return None
+    return cached.get("config")
+
+
+def _write_config_cache(cache_path: str, source: Dict[str, Any], config: Any) -> None:
+    """
+    Atomically write a JSON cache of a parsed YAML configuration.
+
+    The cache is best effort: configurations that do not survive a JSON
+    round trip unchanged, and unwritable directories, are silently skipped.
+
+    Args:
+        cache_path: Path to the JSON cache file
+        source: Tag of the parsed YAML file from ``_config_source_tag``
+        config: Parsed configuration
+    """
+    try:
+        payload = json.dumps({"source": source, "config": config})
+    except (TypeError, ValueError):
+        return
+    if json.loads(payload)["config"] != config:
+        return
+
+    logger = logging.getLogger(__name__)
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(cache_path), suffix=".tmp"
+        )
+    except OSError as e:
+        logger.debug(f"Could not write config cache: {e}")
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write config cache: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml_file(resolved_path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, memoized on its resolved path, modification time and size.
+
+    The ``mtime_ns`` and ``size`` arguments are only part of the cache key:
+    editing the file changes them and forces a fresh parse. Across processes,
+    a JSON copy stored next to the file is used instead of YAML while its
+    modification time, size and SHA-256 all match the file, so edits that
+    keep the timestamp are still picked up.
+
+    Args:
+        resolved_path: Absolute, resolved path to the YAML file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        Parsed YAML content
+    """
+    with open(resolved_path, "rb") as f:
+        content = f.read()
+
+    cache_path = resolved_path + CONFIG_CACHE_SUFFIX
+    source = _config_source_tag(mtime_ns, content)
+    config = _read_config_cache(cache_path, source)
+    if config is not None:
+        return config
+
+    config = yaml.load(content.decode("utf-8"), Loader=SafeLoader)
+
+    _write_config_cache(cache_path, source, config)
+    return config
+
+
 def _load_yaml_config(config_path: str) -> Optional[Dict[str, Any]]:
     """
     Load and parse a YAML configuration file.
@@ -33,26 +164,30 @@ def _load_yaml_config(config_path: str) -> Optional[Dict[str, Any]]:
     logger = logging.getLogger(__name__)
 
     try:
-        # Validate config file exists
+        # Validate config file exists; one stat also yields the cache key
         config_file = Path(config_path)
-        if not config_file.exists():
+        try:
+            file_stat = config_file.stat()
+        except FileNotFoundError:
             logger.error(f"Configuration file not found: {config_path}")
             return None
 
-        if not config_file.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             logger.error(f"Configuration path is not a file: {config_path}")
             return None
 
         # Load YAML configuration
         logger.info(f"Loading configuration from: {config_path}")
-        with open(config_file, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = _parse_yaml_file(
+            str(config_file.resolve()), file_stat.st_mtime_ns, file_stat.st_size
+        )
 
         if not isinstance(config, dict):
             logger.error("Configuration file must contain a YAML dictionary")
             return None
 
-        return config
+        # Callers get their own copy so the cached parse is never mutated
+        return copy.deepcopy(config)
 
     except yaml.YAMLError as e:
         logger.error(f"Error parsing YAML configuration: {e}")
@@ -7,35 +7,32 @@ automated workflows for computational chemistry calculations including
 conformational search, quantum chemical calculations, and thermodynamic analysis.
 """
 
+import json
 import logging
 import os
 import platform
 import shutil
 import subprocess
 import sys
+import threading
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from functools import lru_cache, partial, wraps
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+)
 
 import typer
-import questionary
-from rich import print as rich_print
-from rich.console import Console
-from rich.progress import (
-    Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-)
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.table import Table
+from rich.text import Text
 
-from grimperium.utils.config_manager import load_config
-from grimperium.services.pipeline_orchestrator import (
-    process_single_molecule,
-    validate_pipeline_setup
-)
-from grimperium.services.analysis_service import (
-    generate_progress_report,
-    get_detailed_database_analysis,
-    find_missing_molecules
-)
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
 # Define project root for absolute path resolution
 PROJECT_ROOT = Path(__file__).resolve().parent
@@ -43,6 +40,154 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 # Initialize Rich console
 console = Console()
 
+# Read buffer for batch identifier files (1 MiB)
+BATCH_FILE_BUFFER_SIZE = 1 << 20
+
+# Distribution names used to look up installed library versions
+LIBRARY_DISTRIBUTIONS = {
+    "pandas": "pandas",
+    "typer": "typer",
+    "rich": "rich",
+    "pydantic": "pydantic",
+    "pyyaml": "PyYAML",
+    "requests": "requests",
+}
+
+# Version probes read at most this much of an executable's banner
+VERSION_PROBE_MAX_BYTES = 4096
+
+# Seconds a probed executable may take to exit after its banner was read
+VERSION_PROBE_EXIT_GRACE = 0.5
+
+# Redraw rate of the batch progress bar
+BATCH_PROGRESS_REFRESH_PER_SECOND = 4
+
+# Upper bound on batch worker processes when max_workers is not configured
+DEFAULT_BATCH_MAX_WORKERS = 1
+
+# Batch executor used when batch_executor is not configured
+DEFAULT_BATCH_EXECUTOR = "process"
+
+# Identifiers read from a batch file at a time; repeats are only detected
+# within one window, which bounds memory for arbitrarily long files
+BATCH_WINDOW_SIZE = 10_000
+
+# Batch chunks handed to each worker; larger chunks mean fewer IPC round-trips
+BATCH_CHUNKS_PER_WORKER = 4
+
+# Report progress tiers as (minimum percentage, color, emoji), highest first
+PROGRESS_TIERS = (
+    (90, "green", "🎉"),
+    (75, "blue", "🚀"),
+    (50, "yellow", "⚡"),
+    (25, "orange", "🔥"),
+    (0, "red", "🎯"),
+)
+
+# Command-line options shared by several commands
+CONFIG_FILE_OPTION = typer.Option(
+    "config.yaml", "--config", "-c", help="Path to configuration file"
+)
+VERBOSE_OPTION = typer.Option(
+    False, "--verbose", "-v", help="Enable verbose output"
+)
+QUIET_OPTION = typer.Option(
+    False, "--quiet", "-q", help="Skip the banner and setup progress messages"
+)
+
+# Main menu entries, in display order
+MENU_CHOICES = [
+    "Processar uma única molécula",
+    "Processar um lote de moléculas de um arquivo",
+    "Verificar o status do sistema",
+    "Gerar um relatório de progresso",
+    "Sair",
+]
+
+# questionary style rules for the main menu
+MENU_STYLE_RULES = [
+    ('question', 'bold'),
+    ('answer', 'fg:#ff9d00 bold'),
+    ('pointer', 'fg:#ff9d00 bold'),
+    ('highlighted', 'fg:#ff9d00 bold'),
+    ('selected', 'fg:#cc5454'),
+    ('separator', 'fg:#cc5454'),
+    ('instruction', ''),
+    ('text', ''),
+    ('disabled', 'fg:#858585 italic'),
+]
+
+# Seconds a menu action waits for the background warm-up to finish
+MENU_WARM_UP_JOIN_TIMEOUT = 5.0
+
+# Errors a menu handler reports before returning to the menu; anything else
+# is a bug and propagates to interactive_menu
+MENU_HANDLER_ERRORS = (OSError, ValueError, KeyError, subprocess.SubprocessError)
+
+# Fingerprints of configurations that already passed pipeline validation
+_validated_configs: Set[str] = set()
+
+# Parsed executable version lines, keyed by (name, path, mtime_ns)
+_executable_versions: Dict[Tuple[str, str, int], str] = {}
+
+# Configuration loaded once per batch worker process by _init_batch_worker
+_worker_config: Optional[Dict[str, Any]] = None
+
+# Static banners and status lines, parsed once at import time
+VERSION_BANNER = Text.from_markup(
+    "[bold blue]Grimperium v2[/bold blue] - "
+    "Computational Chemistry Workflow Automation Tool"
+)
+WELCOME_PANEL = Panel.fit(
+    Text.from_markup(
+        "[bold blue]🧪 Grimperium v2[/bold blue]\n"
+        "[cyan]Computational Chemistry Workflow Automation[/cyan]"
+    ),
+    border_style="blue"
+)
+BATCH_WELCOME_PANEL = Panel.fit(
+    Text.from_markup(
+        "[bold blue]🧪 Grimperium v2 - Batch Mode[/bold blue]\n"
+        "[cyan]Computational Chemistry Workflow Automation[/cyan]"
+    ),
+    border_style="blue"
+)
+MENU_WELCOME_PANEL = Panel.fit(
+    Text.from_markup(
+        "[bold blue]🧪 Grimperium v2 - Menu Interativo[/bold blue]\n"
+        "[cyan]Computational Chemistry Workflow Automation[/cyan]"
+    ),
+    border_style="blue"
+)
+INFO_PANEL = Panel.fit(
+    Text.from_markup(
+        "[bold blue]🧪 Grimperium v2 - Diagnóstico do Sistema[/bold blue]"
+    ),
+    border_style="blue"
+)
+REPORT_PANEL = Panel.fit(
+    Text.from_markup("[bold blue]🧪 Grimperium v2 - Progress Report[/bold blue]"),
+    border_style="blue"
+)
+SINGLE_MOLECULE_MENU_PANEL = Panel.fit(
+    Text.from_markup("[bold green]🧪 Processar Uma Única Molécula[/bold green]"),
+    border_style="green"
+)
+BATCH_MENU_PANEL = Panel.fit(
+    Text.from_markup("[bold green]📁 Processar Lote de Moléculas[/bold green]"),
+    border_style="green"
+)
+REPORT_MENU_PANEL = Panel.fit(
+    Text.from_markup("[bold green]📊 Relatório de Progresso[/bold green]"),
+    border_style="green"
+)
+VALIDATING_SETUP_MSG = Text.from_markup(
+    "[yellow]🔧 Validating pipeline setup...[/yellow]"
+)
+SETUP_VALIDATION_FAILED_MSG = Text.from_markup(
+    "[red]❌ Pipeline setup validation failed[/red]"
+)
+
 app = typer.Typer(
     name="grimperium",
     help="Grimperium v2 - Computational Chemistry Workflow Automation Tool",
@@ -60,10 +205,179 @@ def setup_logging(verbose: bool = False):
     )
 
 
+def _count_identifiers(file_path: str) -> int:
+    """Count the identifiers _iter_identifiers yields for a file."""
+    return sum(1 for _ in _iter_identifiers(file_path))
+
+
+def _iter_identifiers(file_path: str) -> Iterator[str]:
+    """Lazily yield the stripped, non-blank lines of an identifier file."""
+    # Text mode splits on \n, \r\n and bare \r alike, and str.strip()
+    # also removes Unicode whitespace such as non-breaking spaces
+    with open(
+        file_path, 'r', encoding='utf-8', buffering=BATCH_FILE_BUFFER_SIZE
+    ) as f:
+        for line in f:
+            identifier = line.strip()
+            if identifier:
+                yield identifier
+
+
+def _make_batch_progress() -> "Progress":
+    """Create the progress bar used for batch runs."""
+    from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn
+
+    # Each molecule takes seconds to minutes, so a low refresh rate suffices
+    return Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TextColumn("({task.completed}/{task.total})"),
+        TimeElapsedColumn(),
+        console=console,
+        refresh_per_second=BATCH_PROGRESS_REFRESH_PER_SECOND,
+    )
+
+
+def _batch_executor_kind(config: Dict[str, Any]) -> str:
+    """Return the configured batch executor kind, "process" or "thread"."""
+    kind = config.get("general_settings", {}).get(
+        "batch_executor", DEFAULT_BATCH_EXECUTOR
+    )
+    if kind not in ("process", "thread"):
+        logging.getLogger(__name__).warning(
+            "Unknown batch_executor %r, using %r", kind, DEFAULT_BATCH_EXECUTOR
+        )
+        return DEFAULT_BATCH_EXECUTOR
+    return kind
+
+
+def _batch_worker_count(
+    config: Dict[str, Any], executor_kind: str, jobs: Optional[int] = None
+) -> int:
+    """Return the number of batch workers allowed by jobs or the config."""
+    if jobs is None:
+        jobs = config.get("general_settings", {}).get(
+            "max_workers", DEFAULT_BATCH_MAX_WORKERS
+        )
+    max_workers = max(1, int(jobs))
+    if executor_kind == "thread":
+        # Threads mostly wait on the network and external programs, so
+        # they are not limited by the CPU count
+        return max_workers
+    return min(os.cpu_count() or 1, max_workers)
+
+
+def _init_batch_worker(config_file: str) -> None:
+    """Load the configuration once in each batch worker process."""
+    from grimperium.utils.config_manager import load_config
+
+    global _worker_config
+    _worker_config = load_config(config_file, PROJECT_ROOT)
+
+
+def _process_batch_identifier(
+    identifier: str, config: Optional[Dict[str, Any]] = None
+) -> bool:
+    """
+    Process one identifier inside a batch worker.
+
+    Args:
+        identifier: Molecule identifier (name or SMILES)
+        config: Configuration to use; defaults to the one loaded by
+            _init_batch_worker in this worker process
+
+    Returns:
+        bool: True if the molecule was processed successfully
+    """
+    from grimperium.services.pipeline_orchestrator import process_single_molecule
+
+    if config is None:
+        config = _worker_config
+
+    try:
+        return bool(process_single_molecule(identifier, config))
+    except Exception:
+        logging.getLogger(__name__).exception("Error processing %s", identifier)
+        return False
+
+
+def _process_batch_group(
+    identifiers: Tuple[str, ...], config: Optional[Dict[str, Any]] = None
+) -> List[bool]:
+    """
+    Process identifiers that share a working directory, one after another.
+
+    Args:
+        identifiers: Identifiers whose working directories collide
+        config: Configuration to use; defaults to the one loaded by
+            _init_batch_worker in this worker process
+
+    Returns:
+        List[bool]: Success of each identifier, in order
+    """
+    return [_process_batch_identifier(identifier, config) for identifier in identifiers]
+
+
+def _group_by_work_dir(identifiers: List[str]) -> List[Tuple[str, ...]]:
+    """
+    Group identifiers that the pipeline would run in the same directory.
+
+    Directory names are sanitized, so for example the cis and trans SMILES
+    C/C=C/C and C/C=C\\C both map to C_C=C_C. Running such identifiers in
+    parallel would let them overwrite each other's files.
+
+    Args:
+        identifiers: Distinct identifiers to process
+
+    Returns:
+        List[Tuple[str, ...]]: Groups in first-seen order
+    """
+    from grimperium.services.pipeline_orchestrator import sanitize_identifier
+
+    groups: Dict[str, List[str]] = {}
+    for identifier in identifiers:
+        # Case-insensitive filesystems also fold names that differ in case
+        work_dir = sanitize_identifier(identifier).casefold()
+        groups.setdefault(work_dir, []).append(identifier)
+    return [tuple(group) for group in groups.values()]
+
+
+def _validate_pipeline_setup_cached(config: Dict[str, Any]) -> bool:
+    """
+    Validate the pipeline setup once per distinct configuration.
+
+    Only successful validations are remembered, so installing a missing
+    executable is picked up on the next attempt. A different config (for
+    example after the file was edited) produces a new fingerprint.
+
+    Args:
+        config: Loaded configuration dictionary
+
+    Returns:
+        bool: True if the pipeline setup is valid
+    """
+    from grimperium.services.pipeline_orchestrator import validate_pipeline_setup
+
+    fingerprint = json.dumps(config, sort_keys=True, default=str)
+    if fingerprint in _validated_configs:
+        return True
+
+    if not validate_pipeline_setup(config):
+        return False
+
+    _validated_configs.add(fingerprint)
+    return True
+
+
 # BUSINESS LOGIC FUNCTIONS (DECOUPLED FROM UI)
 
 def _execute_single_molecule_logic(
-    identifier: str, identifier_type: str, config_file: str, verbose: bool = False
+    identifier: str,
+    identifier_type: str,
+    config_file: str,
+    verbose: bool = False,
+    quiet: bool = False,
 ) -> bool:
     """
     Execute single molecule processing logic.
@@ -73,58 +387,65 @@ def _execute_single_molecule_logic(
         identifier_type: Type of identifier ("name" or "SMILES")
         config_file: Path to configuration file
         verbose: Enable verbose output
+        quiet: Skip the banner and setup progress messages
 
     Returns:
         bool: True if processing was successful, False otherwise
     """
+    from grimperium.utils.config_manager import load_config
+
     setup_logging(verbose)
 
     # Display welcome message
-    console.print(Panel.fit(
-        "[bold blue]🧪 Grimperium v2[/bold blue]\n"
-        "[cyan]Computational Chemistry Workflow Automation[/cyan]",
-        border_style="blue"
-    ))
+    if not quiet:
+        console.print(WELCOME_PANEL)
 
     # Load configuration
-    rich_print(f"[yellow]📋 Loading configuration from: {config_file}[/yellow]")
+    if not quiet:
+        console.print(
+            f"[yellow]📋 Loading configuration from: {config_file}[/yellow]"
+        )
     config = load_config(config_file, PROJECT_ROOT)
     if not config:
-        rich_print(f"[red]❌ Failed to load configuration from: {config_file}[/red]")
+        console.print(f"[red]❌ Failed to load configuration from: {config_file}[/red]")
         return False
 
     # Validate pipeline setup
-    rich_print("[yellow]🔧 Validating pipeline setup...[/yellow]")
-    if not validate_pipeline_setup(config):
-        rich_print("[red]❌ Pipeline setup validation failed[/red]")
+    if not quiet:
+        console.print(VALIDATING_SETUP_MSG)
+    if not _validate_pipeline_setup_cached(config):
+        console.print(SETUP_VALIDATION_FAILED_MSG)
         return False
 
+    # Imported only once the setup is known to be usable
+    from grimperium.services.pipeline_orchestrator import process_single_molecule
+
     # Process the molecule
-    rich_print(
+    console.print(
         f"[green]🚀 Processing molecule ({identifier_type}): {identifier}[/green]"
     )
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        transient=True,
-    ) as progress:
-        progress.add_task("Processing molecule...", total=None)
+    with console.status("[bold cyan]Processing molecule...", spinner="dots"):
         success = process_single_molecule(identifier, config)
 
     # Display results
     if success:
-        rich_print(f"[green]✅ Successfully processed: {identifier}[/green]")
-        rich_print("[green]🎉 Results saved to database![/green]")
+        console.print(f"[green]✅ Successfully processed: {identifier}[/green]")
+        console.print("[green]🎉 Results saved to database![/green]")
         return True
     else:
-        rich_print(f"[red]❌ Failed to process: {identifier}[/red]")
-        rich_print("[red]💥 Check the logs for detailed error information[/red]")
+        console.print(f"[red]❌ Failed to process: {identifier}[/red]")
+        console.print("[red]💥 Check the logs for detailed error information[/red]")
         return False
 
 
 def _execute_batch_logic(
-    file_path: str, config_file: str, verbose: bool = False
+    file_path: Optional[str],
+    config_file: str,
+    verbose: bool = False,
+    identifiers: Optional[List[str]] = None,
+    quiet: bool = False,
+    jobs: Optional[int] = None,
 ) -> dict:
     """
     Execute batch processing logic.
@@ -133,83 +454,174 @@ def _execute_batch_logic(
         file_path: Path to file containing molecule identifiers
         config_file: Path to configuration file
         verbose: Enable verbose output
+        identifiers: Identifiers already read by the caller; when given,
+            file_path is not opened
+        quiet: Skip the banner and setup progress messages
+        jobs: Number of molecules processed at once; overrides max_workers
+            from the configuration
 
     Returns:
         dict: Processing results with counts
     """
-    setup_logging(verbose)
+    from rich.table import Table
+
+    from grimperium.utils.config_manager import load_config
 
     # Display welcome message
-    console.print(Panel.fit(
-        "[bold blue]🧪 Grimperium v2 - Batch Mode[/bold blue]\n"
-        "[cyan]Computational Chemistry Workflow Automation[/cyan]",
-        border_style="blue"
-    ))
+    if not quiet:
+        console.print(BATCH_WELCOME_PANEL)
 
-    # Validate input file
-    input_file = Path(file_path)
-    if not input_file.exists():
-        rich_print(f"[red]❌ Input file not found: {file_path}[/red]")
-        return {"error": f"Input file not found: {file_path}"}
+    if identifiers is not None:
+        total = len(identifiers)
+    else:
+        # Count molecule identifiers; they are streamed from the file later.
+        # Opening the file doubles as the existence check.
+        try:
+            total = _count_identifiers(file_path)
+        except FileNotFoundError:
+            console.print(f"[red]❌ Input file not found: {file_path}[/red]")
+            return {"error": f"Input file not found: {file_path}"}
+        except Exception as e:
+            console.print(f"[red]❌ Error reading input file: {e}[/red]")
+            return {"error": f"Error reading input file: {e}"}
 
-    # Load molecule identifiers
-    try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            identifiers = [line.strip() for line in f if line.strip()]
-    except Exception as e:
-        rich_print(f"[red]❌ Error reading input file: {e}[/red]")
-        return {"error": f"Error reading input file: {e}"}
+    if not total:
+        source = file_path or "identifier list"
+        console.print(f"[red]❌ No molecule identifiers found in: {source}[/red]")
+        return {"error": f"No molecule identifiers found in: {source}"}
 
-    if not identifiers:
-        rich_print(f"[red]❌ No molecule identifiers found in: {file_path}[/red]")
-        return {"error": f"No molecule identifiers found in: {file_path}"}
+    console.print(f"[green]📄 Found {total} molecule identifiers[/green]")
 
-    rich_print(f"[green]📄 Loaded {len(identifiers)} molecule identifiers[/green]")
+    # Input problems exit above without configuring logging
+    setup_logging(verbose)
 
     # Load configuration
-    rich_print(f"[yellow]📋 Loading configuration from: {config_file}[/yellow]")
+    if not quiet:
+        console.print(
+            f"[yellow]📋 Loading configuration from: {config_file}[/yellow]"
+        )
     config = load_config(config_file, PROJECT_ROOT)
     if not config:
-        rich_print(f"[red]❌ Failed to load configuration from: {config_file}[/red]")
+        console.print(f"[red]❌ Failed to load configuration from: {config_file}[/red]")
         return {"error": f"Failed to load configuration from: {config_file}"}
 
     # Validate pipeline setup
-    rich_print("[yellow]🔧 Validating pipeline setup...[/yellow]")
-    if not validate_pipeline_setup(config):
-        rich_print("[red]❌ Pipeline setup validation failed[/red]")
+    if not quiet:
+        console.print(VALIDATING_SETUP_MSG)
+    if not _validate_pipeline_setup_cached(config):
+        console.print(SETUP_VALIDATION_FAILED_MSG)
         return {"error": "Pipeline setup validation failed"}
 
+    # Imported only once the setup is known to be usable
+    from grimperium.services.database_service import smiles_exists
+
     # Process molecules with progress bar
-    rich_print("[green]🚀 Starting batch processing...[/green]")
+    console.print("[green]🚀 Starting batch processing...[/green]")
 
     successful_count = 0
     failed_count = 0
+    skipped_count = 0
 
-    with Progress(
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TextColumn("({task.completed}/{task.total})"),
-        TimeElapsedColumn(),
-    ) as progress:
+    # SMILES already in the PM7 database would only be rejected as
+    # duplicates after the full calculation, so they are skipped up front
+    pm7_db_path = config['database']['pm7_db_path']
 
-        task = progress.add_task("Processing molecules...", total=len(identifiers))
+    executor_kind = _batch_executor_kind(config)
+    workers = _batch_worker_count(config, executor_kind, jobs)
+    pending = (
+        iter(identifiers) if identifiers is not None
+        else _iter_identifiers(file_path)
+    )
 
-        for identifier in identifiers:
-            progress.update(task, description=f"Processing: {identifier[:30]}...")
+    executor: Optional[Executor] = None
+    if workers > 1:
+        if executor_kind == "thread":
+            # Threads share the already loaded config
+            executor = ThreadPoolExecutor(max_workers=workers)
+            worker = partial(_process_batch_group, config=config)
+        else:
+            # Every worker process parses the config once
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_batch_worker,
+                initargs=(config_file,),
+            )
+            worker = _process_batch_group
 
-            try:
-                success = process_single_molecule(identifier, config)
-                if success:
-                    successful_count += 1
-                else:
-                    failed_count += 1
-            except Exception as e:
-                failed_count += 1
-                if verbose:
-                    rich_print(f"[red]❌ Error processing {identifier}: {e}[/red]")
+    with _make_batch_progress() as progress, executor or nullcontext():
+
+        task = progress.add_task("Processing molecules...", total=total)
 
-            progress.update(task, advance=1)
+        def _record(outcome: Optional[bool], count: int) -> None:
+            """Tally one identifier that occurred count times in a window."""
+            nonlocal successful_count, failed_count, skipped_count
+            if outcome is None:
+                skipped_count += count
+            elif outcome:
+                successful_count += 1
+                skipped_count += count - 1
+            else:
+                failed_count += count
+            progress.update(task, advance=count)
+
+        # The input is read in bounded windows so memory stays constant for
+        # long files. Within a window each distinct identifier runs once: a
+        # repeat of a success counts as already calculated, as the database
+        # would reject it, and a repeat of a failure counts as failed
+        for window in iter(lambda: list(islice(pending, BATCH_WINDOW_SIZE)), []):
+            occurrences = Counter(window)
+
+            fresh = []
+            for identifier, count in occurrences.items():
+                if smiles_exists(pm7_db_path, identifier):
+                    _record(None, count)
+                else:
+                    fresh.append(identifier)
+
+            if executor is None:
+                for identifier in fresh:
+                    progress.update(
+                        task, description=f"Processing: {identifier[:30]}..."
+                    )
+                    _record(
+                        _process_batch_identifier(identifier, config),
+                        occurrences[identifier],
+                    )
+                continue
+
+            # Identifiers sharing a working directory stay in one task
+            groups = _group_by_work_dir(fresh)
+
+            # Process pools get groups in chunks so each pickle carries
+            # many of them; threads take them one at a time
+            chunksize = 1
+            if executor_kind == "process":
+                chunksize = max(
+                    1, len(groups) // (workers * BATCH_CHUNKS_PER_WORKER)
+                )
+            done = 0
+            try:
+                for group, outcomes in zip(
+                    groups, executor.map(worker, groups, chunksize=chunksize)
+                ):
+                    for identifier, success in zip(group, outcomes):
+                        _record(success, occurrences[identifier])
+                    done += 1
+            except BrokenProcessPool:
+                # A worker process died (out of memory, crash in a native
+                # library); the pool cannot run anything else
+                logging.getLogger(__name__).exception("Batch worker pool failed")
+                for group in groups[done:]:
+                    for identifier in group:
+                        _record(False, occurrences[identifier])
+                unprocessed = sum(1 for _ in pending)
+                failed_count += unprocessed
+                progress.update(task, advance=unprocessed)
+                console.print(
+                    "[red]❌ A batch worker process stopped unexpectedly; "
+                    "the remaining molecules were not processed.[/red]"
+                )
+                break
 
     # Display final results
     results_table = Table(title="Batch Processing Results")
@@ -217,9 +629,9 @@ def _execute_batch_logic(
     results_table.add_column("Count", justify="right")
     results_table.add_column("Percentage", justify="right")
 
-    total = len(identifiers)
     success_pct = (successful_count / total) * 100 if total > 0 else 0
     failed_pct = (failed_count / total) * 100 if total > 0 else 0
+    skipped_pct = (skipped_count / total) * 100 if total > 0 else 0
 
     results_table.add_row("Total Molecules", str(total), "100.0%")
     results_table.add_row(
@@ -229,17 +641,22 @@ def _execute_batch_logic(
     results_table.add_row(
         "Failed", str(failed_count), f"{failed_pct:.1f}%", style="red"
     )
+    if skipped_count:
+        results_table.add_row(
+            "Already Calculated", str(skipped_count), f"{skipped_pct:.1f}%",
+            style="yellow"
+        )
 
     console.print(results_table)
 
     if successful_count > 0:
-        rich_print(
+        console.print(
             f"[green]🎉 Batch processing completed! {successful_count} "
             f"molecules processed successfully.[/green]"
         )
 
     if failed_count > 0:
-        rich_print(
+        console.print(
             f"[yellow]⚠️  {failed_count} molecules failed processing. "
             f"Check logs for details.[/yellow]"
         )
@@ -248,6 +665,7 @@ def _execute_batch_logic(
         "total": total,
         "successful": successful_count,
         "failed": failed_count,
+        "skipped": skipped_count,
         "success_percentage": success_pct
     }
 
@@ -262,10 +680,9 @@ def _execute_info_logic(config_file: str) -> bool:
     Returns:
         bool: True if info was displayed successfully
     """
-    console.print(Panel.fit(
-        "[bold blue]🧪 Grimperium v2 - Diagnóstico do Sistema[/bold blue]",
-        border_style="blue"
-    ))
+    from rich.table import Table
+
+    console.print(INFO_PANEL)
 
     # Create diagnostic table
     table = Table(title="Sistema e Dependências")
@@ -274,117 +691,163 @@ def _execute_info_logic(config_file: str) -> bool:
     table.add_column("Detalhes / Versão", width=50)
 
     # System Information
-    os_name = platform.system()
-    os_version = platform.release()
-    architecture = platform.machine()
-    python_version = (
-        f"{sys.version_info.major}.{sys.version_info.minor}."
-        f"{sys.version_info.micro}"
-    )
-
-    table.add_row(
-        "Sistema Operacional", "✅", f"{os_name} {os_version} ({architecture})"
-    )
-    table.add_row("Python", "✅", python_version)
+    os_name, os_version, architecture, python_version = get_system_summary()
 
     # Conda Environment
     conda_env = os.environ.get('CONDA_DEFAULT_ENV', 'N/A')
     if conda_env != 'N/A':
-        table.add_row("Ambiente Conda", "✅", conda_env)
+        conda_row = ("Ambiente Conda", "✅", conda_env)
     else:
-        table.add_row("Ambiente Conda", "⚠️", "Não detectado")
+        conda_row = ("Ambiente Conda", "⚠️", "Não detectado")
 
-    # Add separator
-    table.add_row("", "", "")
+    system_rows = [
+        ("Sistema Operacional", "✅", f"{os_name} {os_version} ({architecture})"),
+        ("Python", "✅", python_version),
+        conda_row,
+    ]
 
-    # External Executables
     executables = ["crest", "mopac", "obabel"]
+    libraries = ["pandas", "typer", "rich", "pydantic", "pyyaml", "requests"]
 
+    # Resolve every executable on PATH once and reuse the result below
+    exe_paths = {exe: shutil.which(exe) for exe in executables}
+
+    # Probe executables and libraries concurrently; the version probes spend
+    # most of their time waiting on subprocesses
+    with ThreadPoolExecutor(max_workers=len(executables) + len(libraries)) as pool:
+        exe_probes = {
+            exe: pool.submit(get_executable_version, exe, exe_path)
+            for exe, exe_path in exe_paths.items() if exe_path
+        }
+        lib_probes = {lib: pool.submit(get_library_version, lib) for lib in libraries}
+    lib_versions = {lib: probe.result() for lib, probe in lib_probes.items()}
+
+    # External Executables
+    executable_rows = []
     for exe in executables:
-        exe_path = shutil.which(exe)
+        exe_path = exe_paths[exe]
         if exe_path:
-            version_info = get_executable_version(exe)
-            table.add_row(f"Executável: {exe}", "✅", f"{exe_path}")
-            table.add_row("", "", f"Versão: {version_info}")
+            executable_rows.append((f"Executável: {exe}", "✅", exe_path))
+            executable_rows.append(("", "", f"Versão: {exe_probes[exe].result()}"))
         else:
-            table.add_row(f"Executável: {exe}", "❌", "Não encontrado no PATH")
-
-    # Add separator
-    table.add_row("", "", "")
+            executable_rows.append(
+                (f"Executável: {exe}", "❌", "Não encontrado no PATH")
+            )
 
     # Python Libraries
-    libraries = ["pandas", "typer", "rich", "pydantic", "pyyaml", "requests"]
-
-    for lib in libraries:
-        version = get_library_version(lib)
-        if version != "Not installed":
-            table.add_row(f"Biblioteca: {lib}", "✅", version)
-        else:
-            table.add_row(f"Biblioteca: {lib}", "❌", "Não instalada")
+    library_rows = [
+        (f"Biblioteca: {lib}", "✅", version) if version != "Not installed"
+        else (f"Biblioteca: {lib}", "❌", "Não instalada")
+        for lib, version in lib_versions.items()
+    ]
+
+    # One table section per group; Rich draws the separators between them
+    for rows in (system_rows, executable_rows, library_rows):
+        for row in rows:
+            table.add_row(*row)
+        table.add_section()
 
     console.print(table)
 
     # Configuration Status
-    console.print()
+    from grimperium.utils.config_manager import load_config, validate_executables
+
     config = load_config(config_file, PROJECT_ROOT)
-    if config:
-        console.print("[green]✅ Configuração carregada com sucesso[/green]")
+    if not config:
+        console.print()
+        console.print(f"[red]❌ Falha ao carregar configuração de: {config_file}[/red]")
+        return False
 
-        # Validate executables
-        from grimperium.utils.config_manager import validate_executables
-        if validate_executables(config):
-            console.print(
-                "[green]✅ Todos os executáveis necessários estão disponíveis[/green]"
-            )
-        else:
-            console.print("[red]❌ Alguns executáveis necessários estão faltando[/red]")
+    # Collect the status lines and render them in a single print
+    status = ["", "[green]✅ Configuração carregada com sucesso[/green]"]
 
-        # Validate pipeline setup
-        if validate_pipeline_setup(config):
-            console.print("[green]✅ Configuração do pipeline é válida[/green]")
-        else:
-            console.print("[red]❌ Validação da configuração do pipeline falhou[/red]")
+    # info reports the live state, so executables are always checked here;
+    # failing executables also fail the pipeline, which then needs no check
+    executables_ok = validate_executables(config)
+    pipeline_ok = executables_ok and _validate_pipeline_setup_cached(config)
 
-        # Overall system status
-        console.print()
-        missing_executables = [
-            exe for exe in executables if not shutil.which(exe)
-        ]
-        missing_libraries = [
-            lib for lib in libraries if get_library_version(lib) == "Not installed"
-        ]
-
-        if not missing_executables and not missing_libraries:
-            console.print(
-                "[green]🎉 Sistema configurado corretamente e pronto para "
-                "execução![/green]"
+    # Validate executables
+    if executables_ok:
+        status.append(
+            "[green]✅ Todos os executáveis necessários estão disponíveis[/green]"
+        )
+    else:
+        status.append("[red]❌ Alguns executáveis necessários estão faltando[/red]")
+
+    # Validate pipeline setup
+    if pipeline_ok:
+        status.append("[green]✅ Configuração do pipeline é válida[/green]")
+    else:
+        status.append("[red]❌ Validação da configuração do pipeline falhou[/red]")
+
+    # Overall system status
+    status.append("")
+    missing_executables = [
+        exe for exe, exe_path in exe_paths.items() if not exe_path
+    ]
+    missing_libraries = [
+        lib for lib, version in lib_versions.items()
+        if version == "Not installed"
+    ]
+
+    if not missing_executables and not missing_libraries:
+        status.append(
+            "[green]🎉 Sistema configurado corretamente e pronto para "
+            "execução![/green]"
+        )
+    else:
+        status.append(
+            "[yellow]⚠️  Sistema parcialmente configurado. Algumas "
+            "dependências estão faltando.[/yellow]"
+        )
+
+        if missing_executables:
+            status.append(
+                f"[red]   • Executáveis faltando: "
+                f"{', '.join(missing_executables)}[/red]"
             )
-        else:
-            console.print(
-                "[yellow]⚠️  Sistema parcialmente configurado. Algumas "
-                "dependências estão faltando.[/yellow]"
+        if missing_libraries:
+            status.append(
+                f"[red]   • Bibliotecas faltando: "
+                f"{', '.join(missing_libraries)}[/red]"
             )
 
-            if missing_executables:
-                console.print(
-                    f"[red]   • Executáveis faltando: "
-                    f"{', '.join(missing_executables)}[/red]"
-                )
-            if missing_libraries:
-                console.print(
-                    f"[red]   • Bibliotecas faltando: "
-                    f"{', '.join(missing_libraries)}[/red]"
-                )
+    console.print(Group(*(Text.from_markup(line) for line in status)))
+    return True
 
-        return True
 
-    else:
-        console.print(f"[red]❌ Falha ao carregar configuração de: {config_file}[/red]")
-        return False
+def _database_analysis_row(
+    label: str,
+    analysis: Dict[str, Any],
+    missing_status: str,
+    missing_quality: str,
+) -> Tuple[str, ...]:
+    """
+    Format one row of the detailed database analysis table.
+
+    Args:
+        label: Database name shown in the first column
+        analysis: Result of get_detailed_database_analysis
+        missing_status: Status cell used when the database does not exist
+        missing_quality: Data quality cell used when the database does not exist
+
+    Returns:
+        Tuple of cell strings for Table.add_row
+    """
+    if not analysis['exists']:
+        return (label, missing_status, "0", "0", "0 MB", missing_quality)
+    return (
+        label,
+        "[green]✅ Active[/green]",
+        f"{analysis['total_entries']:,}",
+        f"{analysis['unique_smiles']:,}",
+        f"{analysis['file_size_mb']:.1f} MB",
+        f"[green]{analysis['data_quality']}[/green]",
+    )
 
 
 def _execute_report_logic(
-    config_file: str, detailed: bool = False, missing: int = 0
+    config_file: str, detailed: bool = False, missing: int = 0, quiet: bool = False
 ) -> bool:
     """
     Execute progress report generation logic.
@@ -393,32 +856,43 @@ def _execute_report_logic(
         config_file: Path to configuration file
         detailed: Show detailed analysis
         missing: Number of missing molecules to show
+        quiet: Skip the banner and progress messages
 
     Returns:
         bool: True if report was generated successfully
     """
-    console.print(Panel.fit(
-        "[bold blue]🧪 Grimperium v2 - Progress Report[/bold blue]",
-        border_style="blue"
-    ))
+    from grimperium.utils.config_manager import load_config
+
+    if not quiet:
+        console.print(REPORT_PANEL)
 
     # Load configuration
     config = load_config(config_file, PROJECT_ROOT)
     if not config:
-        rich_print(f"[red]❌ Failed to load configuration from: {config_file}[/red]")
+        console.print(f"[red]❌ Failed to load configuration from: {config_file}[/red]")
         return False
 
+    # pandas-backed analysis is imported only with a usable configuration
+    from rich.table import Table
+
+    from grimperium.services.analysis_service import (
+        generate_progress_report,
+        get_detailed_database_analysis,
+        find_missing_molecules
+    )
+
     # Get database paths from configuration
     cbs_db_path = config['database']['cbs_db_path']
     pm7_db_path = config['database']['pm7_db_path']
 
     # Generate progress report
-    rich_print("[yellow]📊 Analyzing database progress...[/yellow]")
+    if not quiet:
+        console.print("[yellow]📊 Analyzing database progress...[/yellow]")
     report_data = generate_progress_report(cbs_db_path, pm7_db_path)
 
     # Check for errors
     if 'error' in report_data:
-        rich_print(f"[red]❌ Error generating report: {report_data['error']}[/red]")
+        console.print(f"[red]❌ Error generating report: {report_data['error']}[/red]")
         return False
 
     # Create main progress panel
@@ -448,21 +922,14 @@ def _execute_report_logic(
 
     # Progress percentage with color coding
     progress_pct = report_data['progress_percentage']
-    if progress_pct >= 90:
-        progress_color = "green"
-        progress_emoji = "🎉"
-    elif progress_pct >= 75:
-        progress_color = "blue"
-        progress_emoji = "🚀"
-    elif progress_pct >= 50:
-        progress_color = "yellow"
-        progress_emoji = "⚡"
-    elif progress_pct >= 25:
-        progress_color = "orange"
-        progress_emoji = "🔥"
-    else:
-        progress_color = "red"
-        progress_emoji = "🎯"
+    progress_color, progress_emoji = next(
+        (
+            (color, emoji)
+            for threshold, color, emoji in PROGRESS_TIERS
+            if progress_pct >= threshold
+        ),
+        PROGRESS_TIERS[-1][1:],
+    )
 
     progress_content.append("[bold]Overall Progress:[/bold]")
     progress_content.append(
@@ -481,21 +948,30 @@ def _execute_report_logic(
             f"  Extra Calculations: [yellow]{report_data['extra_count']:,}[/yellow]"
         )
 
-    # Display main progress panel
-    console.print(Panel(
+    # Collect every section and render the whole report in a single print
+    renderables = [Panel(
         "\n".join(progress_content),
         title="[bold blue]Grimperium Progress Report[/bold blue]",
         border_style="blue",
         padding=(1, 2)
-    ))
+    )]
 
     # Show detailed analysis if requested
     if detailed:
-        rich_print("\n[yellow]📋 Detailed Database Analysis...[/yellow]")
+        renderables.append(
+            Text.from_markup("\n[yellow]📋 Detailed Database Analysis...[/yellow]")
+        )
 
-        # Analyze CBS database
-        cbs_analysis = get_detailed_database_analysis(cbs_db_path)
-        pm7_analysis = get_detailed_database_analysis(pm7_db_path)
+        # Databases the progress report found missing need no analysis
+        missing_analysis = {'exists': False}
+        cbs_analysis = (
+            get_detailed_database_analysis(cbs_db_path)
+            if report_data['cbs_exists'] else missing_analysis
+        )
+        pm7_analysis = (
+            get_detailed_database_analysis(pm7_db_path)
+            if report_data['pm7_exists'] else missing_analysis
+        )
 
         # Create detailed table
         detail_table = Table(title="Detailed Database Analysis")
@@ -506,101 +982,77 @@ def _execute_report_logic(
         detail_table.add_column("File Size", justify="right")
         detail_table.add_column("Data Quality", justify="center")
 
-        # CBS row
-        if cbs_analysis['exists']:
-            detail_table.add_row(
-                "CBS Reference",
-                "[green]✅ Active[/green]",
-                f"{cbs_analysis['total_entries']:,}",
-                f"{cbs_analysis['unique_smiles']:,}",
-                f"{cbs_analysis['file_size_mb']:.1f} MB",
-                f"[green]{cbs_analysis['data_quality']}[/green]"
-            )
-        else:
-            detail_table.add_row(
-                "CBS Reference",
-                "[red]❌ Missing[/red]",
-                "0",
-                "0",
-                "0 MB",
-                "[red]N/A[/red]"
-            )
-
-        # PM7 row
-        if pm7_analysis['exists']:
-            detail_table.add_row(
-                "PM7 Calculated",
-                "[green]✅ Active[/green]",
-                f"{pm7_analysis['total_entries']:,}",
-                f"{pm7_analysis['unique_smiles']:,}",
-                f"{pm7_analysis['file_size_mb']:.1f} MB",
-                f"[green]{pm7_analysis['data_quality']}[/green]"
-            )
-        else:
-            detail_table.add_row(
-                "PM7 Calculated",
-                "[yellow]⚠️  Empty[/yellow]",
-                "0",
-                "0",
-                "0 MB",
-                "[yellow]Empty[/yellow]"
-            )
+        detail_table.add_row(*_database_analysis_row(
+            "CBS Reference", cbs_analysis,
+            "[red]❌ Missing[/red]", "[red]N/A[/red]"
+        ))
+        detail_table.add_row(*_database_analysis_row(
+            "PM7 Calculated", pm7_analysis,
+            "[yellow]⚠️  Empty[/yellow]", "[yellow]Empty[/yellow]"
+        ))
 
-        console.print(detail_table)
+        renderables.append(detail_table)
 
     # Show missing molecules if requested
     if missing > 0:
-        rich_print(
+        renderables.append(Text.from_markup(
             f"\n[yellow]🔍 Finding {missing} molecules that need "
             "calculation...[/yellow]"
+        ))
+        # The progress report already counted them; skip the scan when none
+        missing_molecules = (
+            find_missing_molecules(cbs_db_path, pm7_db_path, missing)
+            if report_data['missing_count'] > 0
+            else []
         )
-        missing_molecules = find_missing_molecules(cbs_db_path, pm7_db_path, missing)
 
         if missing_molecules:
             missing_table = Table(
                 title=f"Next {len(missing_molecules)} Molecules to Calculate"
             )
             missing_table.add_column("#", justify="right", style="dim")
-            missing_table.add_column("SMILES", style="cyan")
+            missing_table.add_column(
+                "SMILES", style="cyan", no_wrap=True, overflow="ellipsis"
+            )
 
+            # Plain Text cells: SMILES such as "[nH]1cccc1" are not markup,
+            # and skipping the markup lexer matters for long listings
             for i, smiles in enumerate(missing_molecules, 1):
-                missing_table.add_row(str(i), smiles)
+                missing_table.add_row(Text(str(i)), Text(smiles))
 
-            console.print(missing_table)
+            renderables.append(missing_table)
         else:
-            rich_print(
+            renderables.append(Text.from_markup(
                 "[green]🎉 No missing molecules found! All calculations are "
                 "complete.[/green]"
-            )
+            ))
 
     # Success message
     if progress_pct == 100:
-        rich_print(
+        summary = (
             "\n[green]🎉 Congratulations! All reference molecules have been "
             "calculated![/green]"
         )
     elif progress_pct > 0:
-        rich_print(
+        summary = (
             f"\n[blue]📈 Keep up the great work! "
             f"{report_data['missing_count']:,} molecules remaining.[/blue]"
         )
     else:
-        rich_print(
+        summary = (
             f"\n[yellow]🚀 Ready to start calculations! "
             f"{report_data['total_cbs']:,} molecules await processing.[/yellow]"
         )
+    renderables.append(Text.from_markup(summary))
+
+    console.print(Group(*renderables))
 
     return True
 
 
 @app.command()
 def run_single(
-    config_file: str = typer.Option(
-        "config.yaml",
-        "--config",
-        "-c",
-        help="Path to configuration file"
-    ),
+    config_file: str = CONFIG_FILE_OPTION,
     name: Optional[str] = typer.Option(
         None,
         "--name",
@@ -613,12 +1065,8 @@ def run_single(
         "-s",
         help="SMILES string of the molecule"
     ),
-    verbose: bool = typer.Option(
-        False,
-        "--verbose",
-        "-v",
-        help="Enable verbose output"
-    )
+    verbose: bool = VERBOSE_OPTION,
+    quiet: bool = QUIET_OPTION
 ) -> None:
     """
     Process a single molecule through the computational chemistry pipeline.
@@ -630,13 +1078,13 @@ def run_single(
     """
     # Validate input arguments
     if not name and not smiles:
-        rich_print(
+        console.print(
             "[red]❌ Error: You must specify either --name or --smiles[/red]"
         )
         raise typer.Exit(1)
 
     if name and smiles:
-        rich_print("[red]❌ Error: You cannot specify both --name and --smiles[/red]")
+        console.print("[red]❌ Error: You cannot specify both --name and --smiles[/red]")
         raise typer.Exit(1)
 
     # Use the provided identifier
@@ -645,12 +1093,12 @@ def run_single(
 
     # Ensure identifier is not None (should not happen due to validation above)
     if identifier is None:
-        rich_print("[red]❌ Error: No identifier provided[/red]")
+        console.print("[red]❌ Error: No identifier provided[/red]")
         raise typer.Exit(1)
 
     # Call the business logic function
     success = _execute_single_molecule_logic(
-        identifier, identifier_type, config_file, verbose
+        identifier, identifier_type, config_file, verbose, quiet
     )
 
     if not success:
@@ -663,17 +1111,15 @@ def run_batch(
         ...,
         help="Path to text file containing molecule identifiers (one per line)"
     ),
-    config_file: str = typer.Option(
-        "config.yaml",
-        "--config",
-        "-c",
-        help="Path to configuration file"
-    ),
-    verbose: bool = typer.Option(
-        False,
-        "--verbose",
-        "-v",
-        help="Enable verbose output"
+    config_file: str = CONFIG_FILE_OPTION,
+    verbose: bool = VERBOSE_OPTION,
+    quiet: bool = QUIET_OPTION,
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Molecules to process at once (default: max_workers from config)"
     )
 ) -> None:
     """
@@ -684,7 +1130,7 @@ def run_batch(
     with a progress bar.
     """
     # Call the business logic function
-    result = _execute_batch_logic(file, config_file, verbose)
+    result = _execute_batch_logic(file, config_file, verbose, quiet=quiet, jobs=jobs)
 
     if "error" in result:
         raise typer.Exit(1)
@@ -692,12 +1138,7 @@ def run_batch(
 
 @app.command()
 def report(
-    config_file: str = typer.Option(
-        "config.yaml",
-        "--config",
-        "-c",
-        help="Path to configuration file"
-    ),
+    config_file: str = CONFIG_FILE_OPTION,
     detailed: bool = typer.Option(
         False,
         "--detailed",
@@ -709,7 +1150,8 @@ def report(
         "--missing",
         "-m",
         help="Show N missing molecules that need calculation"
-    )
+    ),
+    quiet: bool = QUIET_OPTION
 ) -> None:
     """
     Generate comprehensive progress report comparing CBS reference and
@@ -720,105 +1162,202 @@ def report(
     providing insights into completion status and remaining work.
     """
     # Call the business logic function
-    success = _execute_report_logic(config_file, detailed, missing)
+    success = _execute_report_logic(config_file, detailed, missing, quiet)
 
     if not success:
         raise typer.Exit(1)
 
 
-def get_executable_version(executable_name: str) -> str:
-    """Get version information for an executable."""
+def _probe_version_banner(
+    argv: List[str], timeout: float
+) -> Tuple[Optional[int], str]:
+    """
+    Run a version probe and return its exit code and the head of its output.
+
+    Only the first VERSION_PROBE_MAX_BYTES of the combined stdout/stderr are
+    read. A process still running after that is killed, so chatty or hanging
+    binaries cannot stall the caller.
+
+    Args:
+        argv: Command line of the probe
+        timeout: Seconds to wait for any output before giving up
+
+    Returns:
+        Tuple of the exit code (None if the process had to be killed) and
+        the decoded output head
+
+    Raises:
+        subprocess.TimeoutExpired: If nothing was printed within the timeout
+    """
+    proc = subprocess.Popen(
+        argv,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=0,
+    )
+    timed_out = threading.Event()
+
+    def _expire() -> None:
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(timeout, _expire)
+    watchdog.start()
+    try:
+        # The pipe is unbuffered, so each read returns at most one write of
+        # the child; keep reading until EOF or the byte cap
+        chunks = []
+        remaining = VERSION_PROBE_MAX_BYTES
+        while remaining > 0:
+            chunk = proc.stdout.read(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        output = b"".join(chunks)
+        try:
+            returncode = proc.wait(timeout=VERSION_PROBE_EXIT_GRACE)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            returncode = None
+    finally:
+        watchdog.cancel()
+        proc.stdout.close()
+
+    if timed_out.is_set() and not output:
+        raise subprocess.TimeoutExpired(argv, timeout)
+    if timed_out.is_set():
+        returncode = None
+
+    return returncode, output.decode("utf-8", errors="replace")
+
+
+def get_executable_version(
+    executable_name: str, exe_path: Optional[str] = None
+) -> str:
+    """
+    Get version information for an executable.
+
+    Probes that yield a version line are remembered per resolved path and
+    modification time, so repeated info calls skip the subprocess until the
+    binary on PATH changes. Status messages such as timeouts, errors or
+    "Version info available" are never cached and are retried next call.
+
+    Args:
+        executable_name: Name of the executable
+        exe_path: Location already resolved with shutil.which; looked up
+            on PATH when omitted
+
+    Returns:
+        str: Version line or a short status message
+    """
+    if exe_path is None:
+        exe_path = shutil.which(executable_name)
+    # Avoid forking at all when the binary is not on PATH
+    if not exe_path:
+        return "Executable not found"
+
+    try:
+        cache_key = (executable_name, exe_path, os.stat(exe_path).st_mtime_ns)
+    except OSError:
+        return "Executable not found"
+
+    version = _executable_versions.get(cache_key)
+    if version is None:
+        version, parsed = _probe_executable_version(executable_name, exe_path)
+        # Fallback messages are retried on the next call
+        if parsed:
+            _executable_versions[cache_key] = version
+    return version
+
+
+def _probe_executable_version(
+    executable_name: str, exe_path: str
+) -> Tuple[str, bool]:
+    """
+    Run the version probe for an executable resolved to exe_path.
+
+    Returns:
+        Tuple of the version line or status message, and whether a version
+        line was actually parsed from the output
+    """
     try:
         if executable_name == "crest":
-            result = subprocess.run(
-                [executable_name, "--version"],
-                capture_output=True, text=True, timeout=10
+            returncode, output = _probe_version_banner(
+                [exe_path, "--version"], timeout=10
             )
-            if result.returncode == 0:
+            if returncode in (0, None):
                 # Extract version from output (format may vary)
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
+                for line in output.strip().splitlines():
                     if 'version' in line.lower() or 'crest' in line.lower():
-                        return line.strip()
-                return "Version info available"
-            return "Version unavailable"
+                        return line.strip(), True
+                return "Version info available", False
+            return "Version unavailable", False
 
         elif executable_name == "obabel":
-            result = subprocess.run(
-                [executable_name, "--version"],
-                capture_output=True, text=True, timeout=10
+            returncode, output = _probe_version_banner(
+                [exe_path, "--version"], timeout=10
             )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
+            if returncode in (0, None):
+                for line in output.strip().splitlines():
                     if 'open babel' in line.lower() or 'version' in line.lower():
-                        return line.strip()
-                return "Version info available"
-            return "Version unavailable"
+                        return line.strip(), True
+                return "Version info available", False
+            return "Version unavailable", False
 
         elif executable_name == "mopac":
-            result = subprocess.run(
-                [executable_name],
-                capture_output=True, text=True, timeout=10
-            )
-            # MOPAC might return version info in stderr or stdout
-            output = result.stdout + result.stderr
-            lines = output.strip().split('\n')
-            for line in lines:
+            # MOPAC prints its banner and exits quickly without input;
+            # version info may be on either stream, which the probe merges
+            _, output = _probe_version_banner([exe_path], timeout=3)
+            for line in output.strip().splitlines():
                 if 'mopac' in line.lower() or 'version' in line.lower():
-                    return line.strip()
-            return "MOPAC detected"
+                    return line.strip(), True
+            return "MOPAC detected", False
 
         else:
-            return "Version check not implemented"
+            return "Version check not implemented", False
 
     except subprocess.TimeoutExpired:
-        return "Timeout getting version"
+        return "Timeout getting version", False
     except FileNotFoundError:
-        return "Executable not found"
+        return "Executable not found", False
     except Exception as e:
-        return f"Error: {str(e)}"
+        return f"Error: {str(e)}", False
 
 
+def get_system_summary() -> Tuple[str, str, str, str]:
+    """Get OS name, OS release, architecture and Python version."""
+    uname = platform.uname()
+    python_version = (
+        f"{sys.version_info.major}.{sys.version_info.minor}."
+        f"{sys.version_info.micro}"
+    )
+    return uname.system, uname.release, uname.machine, python_version
+
+
+@lru_cache(maxsize=None)
 def get_library_version(library_name: str) -> str:
     """Get version of a Python library."""
+    from importlib import metadata
+
+    dist_name = LIBRARY_DISTRIBUTIONS.get(library_name)
+    if dist_name is None:
+        return "Unknown library"
+
+    # Read the installed distribution metadata instead of importing the package
     try:
-        if library_name == "pandas":
-            import pandas
-            return pandas.__version__
-        elif library_name == "typer":
-            import typer
-            return typer.__version__
-        elif library_name == "rich":
-            import rich
-            return getattr(rich, '__version__', 'Version unavailable')
-        elif library_name == "pydantic":
-            import pydantic
-            return pydantic.__version__
-        elif library_name == "pyyaml":
-            import yaml
-            return yaml.__version__
-        elif library_name == "requests":
-            import requests
-            return requests.__version__
-        else:
-            return "Unknown library"
-    except ImportError:
+        return metadata.version(dist_name)
+    except metadata.PackageNotFoundError:
         return "Not installed"
-    except AttributeError:
-        return "Version unavailable"
     except Exception as e:
         return f"Error: {str(e)}"
 
 
 @app.command()
 def info(
-    config_file: str = typer.Option(
-        "config.yaml",
-        "--config",
-        "-c",
-        help="Path to configuration file"
-    )
+    config_file: str = CONFIG_FILE_OPTION
 ) -> None:
     """
     Display comprehensive system information and diagnostic report.
@@ -830,70 +1369,165 @@ def info(
         raise typer.Exit(1)
 
 
+def _press_any_key(message: str = "Pressione qualquer tecla para continuar...") -> None:
+    """
+    Wait for a single keypress without starting a prompt_toolkit application.
+
+    Args:
+        message: Prompt shown before waiting
+    """
+    console.print(message, highlight=False)
+    if not sys.stdin.isatty():
+        return
+
+    try:
+        import msvcrt
+    except ImportError:
+        import termios
+        import tty
+
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setraw(fd)
+            sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    else:
+        msvcrt.getch()
+
+
+def menu_action(
+    error_message: str, panel: Optional[Panel] = None
+) -> Callable[[Callable[[], None]], Callable[[], None]]:
+    """
+    Wrap an interactive menu handler with the shared header and footer.
+
+    The wrapped handler prints ``panel`` first, reports any of
+    MENU_HANDLER_ERRORS as ``error_message`` and always waits for a
+    keypress before returning to the menu.
+
+    Args:
+        error_message: Prefix shown in front of a handled error
+        panel: Header printed before the handler runs
+
+    Returns:
+        Decorator applied to the handler
+    """
+    def decorator(handler: Callable[[], None]) -> Callable[[], None]:
+        @wraps(handler)
+        def wrapper() -> None:
+            if panel is not None:
+                console.print(panel)
+            try:
+                handler()
+            except MENU_HANDLER_ERRORS as e:
+                console.print(f"[red]❌ {error_message}: {e}[/red]")
+
+            # Pause before returning to menu
+            _press_any_key()
+
+        return wrapper
+
+    return decorator
+
+
+def _warm_menu_caches(config_file: str) -> None:
+    """
+    Parse the configuration and import the service modules ahead of the
+    first action.
+
+    Runs in a background thread while the menu waits for input. Only the
+    YAML parse is warmed: load_config also creates the configured
+    directories, which is left to the handler that needs them. Warming is
+    best effort: the handlers load everything themselves if it fails.
+
+    Args:
+        config_file: Path to configuration file
+    """
+    try:
+        from grimperium.utils.config_manager import _parse_yaml_file
+
+        # Same cache key as load_config uses, so the first handler reuses
+        # the parse; a missing config is reported by the handlers
+        config_path = Path(config_file)
+        file_stat = config_path.stat()
+        _parse_yaml_file(
+            str(config_path.resolve()), file_stat.st_mtime_ns, file_stat.st_size
+        )
+
+        # pandas and pubchempy dominate the first handler's import time
+        import grimperium.services.analysis_service  # noqa: F401
+        import grimperium.services.pipeline_orchestrator  # noqa: F401
+    except Exception as e:
+        logging.getLogger(__name__).debug(f"Menu warm-up failed: {e}")
+
+
 def interactive_menu():
     """
     Interactive menu for Grimperium using questionary.
     """
-    console.print(Panel.fit(
-        "[bold blue]🧪 Grimperium v2 - Menu Interativo[/bold blue]\n"
-        "[cyan]Computational Chemistry Workflow Automation[/cyan]",
-        border_style="blue"
-    ))
+    import questionary
+
+    console.print(MENU_WELCOME_PANEL)
+
+    # Overlap config parsing and service imports with the user's first choice
+    warm_up = threading.Thread(
+        target=_warm_menu_caches, args=('config.yaml',), daemon=True
+    )
+    warm_up.start()
+
+    # Built once; the menu is redrawn after every action
+    style = questionary.Style(MENU_STYLE_RULES)
+    handlers = {
+        "Processar uma única molécula": handle_single_molecule,
+        "Processar um lote de moléculas de um arquivo": handle_batch_molecules,
+        "Verificar o status do sistema": handle_system_info,
+        "Gerar um relatório de progresso": handle_progress_report,
+    }
 
     while True:
+        handler = None
         try:
             choice = questionary.select(
                 "O que você gostaria de fazer?",
-                choices=[
-                    "Processar uma única molécula",
-                    "Processar um lote de moléculas de um arquivo",
-                    "Verificar o status do sistema",
-                    "Gerar um relatório de progresso",
-                    "Sair"
-                ],
-                style=questionary.Style([
-                    ('question', 'bold'),
-                    ('answer', 'fg:#ff9d00 bold'),
-                    ('pointer', 'fg:#ff9d00 bold'),
-                    ('highlighted', 'fg:#ff9d00 bold'),
-                    ('selected', 'fg:#cc5454'),
-                    ('separator', 'fg:#cc5454'),
-                    ('instruction', ''),
-                    ('text', ''),
-                    ('disabled', 'fg:#858585 italic')
-                ])
+                choices=MENU_CHOICES,
+                style=style,
             ).ask()
 
-            if choice == "Processar uma única molécula":
-                handle_single_molecule()
-            elif choice == "Processar um lote de moléculas de um arquivo":
-                handle_batch_molecules()
-            elif choice == "Verificar o status do sistema":
-                handle_system_info()
-            elif choice == "Gerar um relatório de progresso":
-                handle_progress_report()
+            handler = handlers.get(choice)
+            if handler is not None:
+                # Let the warm-up finish rather than race it for the same
+                # config parse and imports; it is best effort, so only wait
+                # briefly
+                warm_up.join(MENU_WARM_UP_JOIN_TIMEOUT)
+                handler()
             elif choice == "Sair":
-                rich_print("[cyan]👋 Obrigado por usar o Grimperium![/cyan]")
+                console.print("[cyan]👋 Obrigado por usar o Grimperium![/cyan]")
                 break
             else:
-                rich_print("[red]❌ Opção inválida[/red]")
+                console.print("[red]❌ Opção inválida[/red]")
 
         except KeyboardInterrupt:
-            rich_print("\n[cyan]👋 Operação cancelada. Até logo![/cyan]")
+            console.print("\n[cyan]👋 Operação cancelada. Até logo![/cyan]")
             break
         except Exception as e:
-            rich_print(f"[red]❌ Erro inesperado: {e}[/red]")
-            break
+            console.print(f"[red]❌ Erro inesperado: {e}[/red]")
+            if handler is None:
+                # The prompt itself failed; showing it again would fail too
+                break
+            # A handler bug should not end the session; keep the traceback
+            logging.getLogger(__name__).exception(
+                "Unhandled error in menu action %r", choice
+            )
 
 
+@menu_action("Erro no processamento", SINGLE_MOLECULE_MENU_PANEL)
 def handle_single_molecule():
     """
     Handle single molecule processing through interactive prompts.
     """
-    console.print(Panel.fit(
-        "[bold green]🧪 Processar Uma Única Molécula[/bold green]",
-        border_style="green"
-    ))
+    import questionary
 
     # Ask for input type
     input_type = questionary.select(
@@ -908,17 +1542,7 @@ def handle_single_molecule():
                 len(text.strip()) > 0 or "O nome não pode estar vazio"
             )
         ).ask()
-
-        if molecule_input:
-            try:
-                _execute_single_molecule_logic(
-                    identifier=molecule_input.strip(),
-                    identifier_type="name",
-                    config_file='config.yaml',
-                    verbose=False
-                )
-            except Exception as e:
-                rich_print(f"[red]❌ Erro no processamento: {e}[/red]")
+        identifier_type = "name"
 
     elif input_type == "SMILES":
         molecule_input = questionary.text(
@@ -927,82 +1551,75 @@ def handle_single_molecule():
                 len(text.strip()) > 0 or "O SMILES não pode estar vazio"
             )
         ).ask()
+        identifier_type = "SMILES"
 
-        if molecule_input:
-            try:
-                _execute_single_molecule_logic(
-                    identifier=molecule_input.strip(),
-                    identifier_type="SMILES",
-                    config_file='config.yaml',
-                    verbose=False
-                )
-            except Exception as e:
-                rich_print(f"[red]❌ Erro no processamento: {e}[/red]")
+    else:
+        return
 
-    # Pause before returning to menu
-    questionary.press_any_key_to_continue(
-        "Pressione qualquer tecla para continuar..."
-    ).ask()
+    if molecule_input:
+        _execute_single_molecule_logic(
+            identifier=molecule_input.strip(),
+            identifier_type=identifier_type,
+            config_file='config.yaml',
+            verbose=False,
+            quiet=True
+        )
 
 
+@menu_action("Erro no processamento do lote", BATCH_MENU_PANEL)
 def handle_batch_molecules():
     """
     Handle batch molecule processing through interactive prompts.
     """
-    console.print(Panel.fit(
-        "[bold green]📁 Processar Lote de Moléculas[/bold green]",
-        border_style="green"
-    ))
+    import questionary
 
-    # Ask for file path
+    # Ask for file path; the existence check runs on submit, not per keystroke
     file_path = questionary.path(
         "Selecione o arquivo com as moléculas (um identificador por linha):",
-        validate=lambda path: Path(path).exists() or "Arquivo não encontrado"
+        validate=lambda path: os.path.exists(path) or "Arquivo não encontrado",
+        validate_while_typing=False
     ).ask()
 
     if file_path:
-        try:
-            result = _execute_batch_logic(
-                file_path=file_path,
-                config_file='config.yaml',
-                verbose=False
+        # Read the file once; the batch logic works on the list directly
+        identifiers = list(_iter_identifiers(file_path))
+        result = _execute_batch_logic(
+            file_path=file_path,
+            config_file='config.yaml',
+            verbose=False,
+            identifiers=identifiers,
+            quiet=True
+        )
+        if "error" in result:
+            console.print(
+                f"[red]❌ Erro no processamento do lote: {result['error']}[/red]"
             )
-            if "error" in result:
-                rich_print(
-                    f"[red]❌ Erro no processamento do lote: {result['error']}[/red]"
-                )
-        except Exception as e:
-            rich_print(f"[red]❌ Erro no processamento do lote: {e}[/red]")
-
-    # Pause before returning to menu
-    questionary.press_any_key_to_continue(
-        "Pressione qualquer tecla para continuar..."
-    ).ask()
 
 
+@menu_action("Erro ao obter informações do sistema")
 def handle_system_info():
     """
     Handle system information display.
     """
-    try:
-        _execute_info_logic(config_file='config.yaml')
-    except Exception as e:
-        rich_print(f"[red]❌ Erro ao obter informações do sistema: {e}[/red]")
+    _execute_info_logic(config_file='config.yaml')
 
-    # Pause before returning to menu
-    questionary.press_any_key_to_continue(
-        "Pressione qualquer tecla para continuar..."
-    ).ask()
+
+def _validate_positive_int(text: str) -> Union[bool, str]:
+    """Validate a prompt answer as a positive integer with a single parse."""
+    try:
+        if int(text) > 0:
+            return True
+    except ValueError:
+        pass
+    return "Digite um número válido maior que 0"
 
 
+@menu_action("Erro ao gerar relatório", REPORT_MENU_PANEL)
 def handle_progress_report():
     """
     Handle progress report generation.
     """
-    console.print(Panel.fit(
-        "[bold green]📊 Relatório de Progresso[/bold green]",
-        border_style="green"
-    ))
+    import questionary
 
     # Ask for report options
     detailed = questionary.confirm(
@@ -1018,26 +1635,16 @@ def handle_progress_report():
         missing_count = questionary.text(
             "Quantas moléculas mostrar?",
             default="10",
-            validate=lambda text: (
-                text.isdigit() and int(text) > 0 or
-                "Digite um número válido maior que 0"
-            )
+            validate=_validate_positive_int
         ).ask()
         missing_count = int(missing_count) if missing_count else 0
 
-    try:
-        _execute_report_logic(
-            config_file='config.yaml',
-            detailed=detailed,
-            missing=missing_count
-        )
-    except Exception as e:
-        rich_print(f"[red]❌ Erro ao gerar relatório: {e}[/red]")
-
-    # Pause before returning to menu
-    questionary.press_any_key_to_continue(
-        "Pressione qualquer tecla para continuar..."
-    ).ask()
+    _execute_report_logic(
+        config_file='config.yaml',
+        detailed=detailed,
+        missing=missing_count,
+        quiet=True
+    )
 
 
 @app.callback(invoke_without_command=True)
@@ -1055,10 +1662,7 @@ def main_callback(
     Run without arguments to start the interactive menu.
     """
     if version:
-        rich_print(
-            "[bold blue]Grimperium v2[/bold blue] - "
-            "Computational Chemistry Workflow Automation Tool"
-        )
+        console.print(VERSION_BANNER)
         return
 
     # If no subcommand was invoked, start interactive menu
@@ -1067,4 +1671,8 @@ def main_callback(
 
 
 if __name__ == "__main__":
+    # A bare --version needs no command parsing
+    if sys.argv[1:] == ["--version"]:
+        console.print(VERSION_BANNER)
+        sys.exit(0)
     app()